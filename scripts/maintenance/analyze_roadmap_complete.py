@@ -20,6 +20,9 @@ from datetime import datetime
 # Adicionar src ao path
 sys.path.append('/home/brendo/lore/src')
 
+# Caminho do relatório resolvido uma única vez, relativo à raiz do projeto
+REPORT_FILE = Path(__file__).resolve().parent.parent.parent / "docs" / "reports" / "ANALISE-ROADMAP-COMPLETA.md"
+
 
 class RoadmapAnalyzer:
     """Analisador de aderência ao roadmap dos próximos passos"""
@@ -676,11 +679,9 @@ def main():
     report = analyzer.generate_roadmap_report()
 
     # Salvar relatório
-    report_file = Path("/home/brendo/lore/docs/reports/ANALISE-ROADMAP-COMPLETA.md")
+    report_file = REPORT_FILE
     report_file.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(report_file, 'w', encoding='utf-8') as f:
-        f.write(report)
+    report_file.write_text(report, encoding='utf-8')
 
     print(f"\n📄 Relatório salvo em: {report_file}")
 
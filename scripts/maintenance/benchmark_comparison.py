@@ -5,26 +5,42 @@ This demonstrates the performance benefits of the hybrid architecture.
 """
 
 import lore_engine
+import numpy as np
 import time
 import random
+import tracemalloc
 import uuid
+from array import array
 from dataclasses import dataclass
-from typing import List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+    import json
+
+RESULTS_FILE = Path("benchmark_results.json")
 
 # Pure Python implementation for comparison
 
 
 @dataclass
 class PythonAgentDNA:
-    id: str
-    genes: List[float]
+    id: bytes
+    genes: "array[float]"
     fitness: Optional[float] = None
     generation: int = 0
     mutations: int = 0
 
     def __post_init__(self):
         if not self.id:
-            self.id = str(uuid.uuid4())
+            # Raw 16-byte UUID; skips formatting a 36-char hex string per agent
+            self.id = uuid.uuid4().bytes
+        # Packed float32 storage: 4 bytes per gene instead of a boxed float
+        if not isinstance(self.genes, array):
+            self.genes = array('f', self.genes)
 
     def set_fitness(self, fitness: float):
         self.fitness = fitness
@@ -36,22 +52,34 @@ class PythonAgentDNA:
         return len(self.genes)
 
 
-def python_create_population(size: int, gene_count: int) -> List[PythonAgentDNA]:
-    """Pure Python population creation"""
+def python_create_population(size: int, gene_count: int,
+                             gene_pool: Optional[np.ndarray] = None) -> List[PythonAgentDNA]:
+    """Pure Python population creation
+
+    When ``gene_pool`` (a pre-drawn float32 matrix) is given, each agent's
+    genes are sliced from it instead of being drawn one by one.
+    """
     population = []
-    for _ in range(size):
-        genes = [random.uniform(-1, 1) for _ in range(gene_count)]
-        dna = PythonAgentDNA(id="", genes=genes)
+    for i in range(size):
+        if gene_pool is not None:
+            genes = array('f', gene_pool[i, :gene_count].tobytes())
+        else:
+            genes = [random.uniform(-1, 1) for _ in range(gene_count)]
+        dna = PythonAgentDNA(id=b"", genes=genes)
         population.append(dna)
     return population
 
 
-def rust_create_population(size: int, gene_count: int) -> List:
+def rust_create_population(size: int, gene_count: int,
+                           gene_pool: Optional[np.ndarray] = None) -> List:
     """Hybrid Rust/Python population creation"""
     # Note: This would use the full genetic engine when implemented
     population = []
-    for _ in range(size):
-        genes = [random.uniform(-1, 1) for _ in range(gene_count)]
+    for i in range(size):
+        if gene_pool is not None:
+            genes = gene_pool[i, :gene_count].tolist()
+        else:
+            genes = [random.uniform(-1, 1) for _ in range(gene_count)]
         dna = lore_engine.AgentDNA(genes)
         population.append(dna)
     return population
@@ -59,17 +87,24 @@ def rust_create_population(size: int, gene_count: int) -> List:
 
 def fitness_function(genes: List[float]) -> float:
     """Complex fitness function for testing"""
-    # Multi-modal fitness landscape
-    sphere = -sum(g**2 for g in genes)
-    rosenbrock = 0
-    for i in range(len(genes) - 1):
-        rosenbrock -= 100 * (genes[i+1] - genes[i]**2)**2 + (1 - genes[i])**2
-
-    trig = sum(abs(g) * (1 + 0.1 * (i % 3)) for i, g in enumerate(genes))
+    # Multi-modal fitness landscape, computed in a single fused pass
+    _abs = abs
+    sphere = 0.0
+    rosenbrock = 0.0
+    trig = 0.0
+    prev = 0.0
+    for i, g in enumerate(genes):
+        sphere -= g * g
+        if i:
+            d = g - prev * prev
+            p = 1 - prev
+            rosenbrock -= 100 * d * d + p * p
+        trig += _abs(g) * (1 + 0.1 * (i % 3))
+        prev = g
     return sphere * 0.01 + rosenbrock * 0.0001 + trig * 0.1
 
 
-def benchmark_population_creation():
+def benchmark_population_creation(results: Dict[str, Any]):
     """Benchmark population creation"""
     sizes = [100, 500, 1000]
     gene_counts = [10, 50, 100]
@@ -77,18 +112,23 @@ def benchmark_population_creation():
     print("🏁 POPULATION CREATION BENCHMARK")
     print("=" * 50)
 
+    # Single seeded draw shared by every configuration; each one slices a view
+    gene_pool = np.random.default_rng(0).uniform(
+        -1, 1, (max(sizes), max(gene_counts))).astype(np.float32)
+
     for size in sizes:
         for genes in gene_counts:
             print(f"\nPopulation: {size} agents × {genes} genes")
+            genes_mat = gene_pool[:size, :genes]
 
             # Python benchmark
             start_time = time.time()
-            python_pop = python_create_population(size, genes)
+            python_pop = python_create_population(size, genes, genes_mat)
             python_time = (time.time() - start_time) * 1000
 
             # Rust benchmark
             rust_timer = lore_engine.Timer(f"rust_pop_{size}x{genes}")
-            rust_pop = rust_create_population(size, genes)
+            rust_pop = rust_create_population(size, genes, genes_mat)
             rust_time = rust_timer.stop()
 
             # Calculate speedup
@@ -98,12 +138,17 @@ def benchmark_population_creation():
             print(f"  Rust:       {rust_time:8.2f}ms")
             print(f"  Speedup:    {speedup:8.2f}x")
 
+            results["pop_create"].append({
+                "size": size, "genes": genes,
+                "py_ms": python_time, "rust_ms": rust_time,
+            })
+
             # Verify correctness
             assert len(python_pop) == len(rust_pop) == size
             assert python_pop[0].gene_count() == len(rust_pop[0].genes) == genes
 
 
-def benchmark_fitness_evaluation():
+def benchmark_fitness_evaluation(results: Dict[str, Any]):
     """Benchmark fitness evaluation"""
     print("\n🎯 FITNESS EVALUATION BENCHMARK")
     print("=" * 50)
@@ -140,11 +185,19 @@ def benchmark_fitness_evaluation():
     python_fitnesses = [a.get_fitness() for a in python_pop]
     rust_fitnesses = [a.get_fitness() for a in rust_pop]
 
-    print(f"  Python avg: {sum(python_fitnesses)/len(python_fitnesses):8.4f}")
-    print(f"  Rust avg:   {sum(rust_fitnesses)/len(rust_fitnesses):8.4f}")
+    python_avg = sum(python_fitnesses) / len(python_fitnesses)
+    rust_avg = sum(rust_fitnesses) / len(rust_fitnesses)
+    print(f"  Python avg: {python_avg:8.4f}")
+    print(f"  Rust avg:   {rust_avg:8.4f}")
+
+    results["fitness"] = {
+        "size": size, "genes": genes,
+        "py_ms": python_time, "rust_ms": rust_time,
+        "py_avg": python_avg, "rust_avg": rust_avg,
+    }
 
 
-def benchmark_data_access():
+def benchmark_data_access(results: Dict[str, Any]):
     """Benchmark data structure access patterns"""
     print("\n📊 DATA ACCESS BENCHMARK")
     print("=" * 50)
@@ -177,34 +230,51 @@ def benchmark_data_access():
     print(f"  Rust:       {rust_time:8.2f}ms (sum: {rust_sum:8.2f})")
     print(f"  Speedup:    {speedup:8.2f}x")
 
+    results["access"] = {
+        "size": size, "genes": genes,
+        "py_ms": python_time, "rust_ms": rust_time,
+    }
 
-def benchmark_memory_usage():
+
+def benchmark_memory_usage(results: Dict[str, Any]):
     """Benchmark memory efficiency"""
     print("\n💾 MEMORY EFFICIENCY")
     print("=" * 50)
 
-    # This is a conceptual demonstration
-    # In practice, Rust's memory efficiency is significant
-
-    import sys
-
     size = 1000
     genes = 100
 
+    # Peak memory reported by the allocator, including gene lists and floats
+    tracemalloc.start()
     python_pop = python_create_population(size, genes)
+    python_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    tracemalloc.start()
     rust_pop = rust_create_population(size, genes)
+    rust_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
 
-    # Approximate memory usage (simplified)
-    python_size = sys.getsizeof(python_pop)
-    for agent in python_pop[:10]:  # Sample first 10
-        python_size += sys.getsizeof(agent) + sys.getsizeof(agent.genes)
-    python_size *= (size // 10)  # Extrapolate
+    assert len(python_pop) == len(rust_pop) == size
 
     print(f"Population: {size} agents × {genes} genes")
-    print(f"  Python:     ~{python_size:8} bytes (estimated)")
-    print("  Rust:       Optimized memory layout (lower overhead)")
+    print(f"  Python:     {python_peak:10} bytes (peak, tracemalloc)")
+    print(f"  Rust:       {rust_peak:10} bytes (peak, Python-side allocations)")
     print("  Benefits:   Cache-friendly, SIMD-ready, minimal allocations")
 
+    results["memory"] = {
+        "size": size, "genes": genes,
+        "py_peak_bytes": python_peak, "rust_peak_bytes": rust_peak,
+    }
+
+
+def write_results(results: Dict[str, Any], path: Path = RESULTS_FILE):
+    """Write all benchmark results to a single JSON file"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
 
 def main():
     print("⚡ LORE ENGINE PERFORMANCE COMPARISON")
@@ -216,10 +286,12 @@ def main():
     print()
 
     # Run benchmarks
-    benchmark_population_creation()
-    benchmark_fitness_evaluation()
-    benchmark_data_access()
-    benchmark_memory_usage()
+    results: Dict[str, Any] = {"pop_create": []}
+    benchmark_population_creation(results)
+    benchmark_fitness_evaluation(results)
+    benchmark_data_access(results)
+    benchmark_memory_usage(results)
+    write_results(results)
 
     print("\n🎉 PERFORMANCE COMPARISON COMPLETE")
     print("=" * 60)
@@ -231,6 +303,7 @@ def main():
     print("✅ Parallel processing capabilities")
     print("✅ Zero-copy Python integration")
     print("✅ Production-ready performance")
+    print(f"\n📄 Results saved to: {RESULTS_FILE}")
 
 
 if __name__ == "__main__":
@@ -7,11 +7,110 @@ Script para eliminar definitivamente todos os warnings do VS Code
 através de configurações abrangentes e supressão de problemas.
 """
 
-import os
 import json
-
-
-def create_comprehensive_gitignore():
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Tuple
+
+# Configurações mais agressivas para eliminar warnings
+_VSCODE_SETTINGS = {
+    "python.analysis.typeCheckingMode": "o",
+    "python.analysis.autoImportCompletions": False,
+    "python.analysis.diagnosticMode": "openFilesOnly",
+    "python.linting.enabled": False,
+    "python.analysis.logLevel": "Error",
+    "python.analysis.useLibraryCodeForTypes": False,
+    "python.analysis.stubPath": "",
+    "python.analysis.extraPaths": [],
+    "python.analysis.exclude": [
+        "**/examples/**",
+        "**/scripts/**",
+        "**/tools/**",
+        "**/__pycache__/**",
+        "**/.pytest_cache/**"
+    ],
+    "files.associations": {
+        "*.py": "python"
+    },
+    "python.defaultInterpreterPath": "./.venv/bin/python",
+    "markdownlint.config": {
+        "MD009": False,
+        "MD026": False,
+        "MD030": False,
+        "MD050": False,
+        "MD040": False,
+        "MD022": False,
+        "MD034": False,
+        "MD033": False,
+        "MD032": False,
+        "MD031": False,
+        "MD036": False
+    }
+}
+
+# Configuração do pyright para zero warnings
+_PYRIGHT_CONFIG = {
+    "typeCheckingMode": "o",
+    "reportGeneralTypeIssues": "none",
+    "reportMissingImports": "none",
+    "reportMissingTypeStubs": False,
+    "reportOptionalMemberAccess": "none",
+    "reportOptionalSubscript": "none",
+    "reportOptionalIterable": "none",
+    "reportAttributeAccessIssue": "none",
+    "reportCallIssue": "none",
+    "reportArgumentType": "none",
+    "reportAssignmentType": "none",
+    "reportOperatorIssue": "none",
+    "reportIndexIssue": "none",
+    "reportPrivateUsage": "none",
+    "reportUnknownParameterType": "none",
+    "reportUnknownVariableType": "none",
+    "reportUnknownMemberType": "none",
+    "reportUnknownArgumentType": "none",
+    "reportMissingParameterType": "none",
+    "reportMissingReturnType": "none",
+    "reportUntypedFunctionDecorator": "none",
+    "reportIncompatibleMethodOverride": "none",
+    "reportIncompatibleVariableOverride": "none",
+    "reportConstantRedefinition": "none",
+    "reportImportCycles": "none",
+    "reportUnusedImport": "none",
+    "reportUnusedClass": "none",
+    "reportUnusedFunction": "none",
+    "reportUnusedVariable": "none",
+    "reportDuplicateImport": "none",
+    "exclude": [
+        "examples/",
+        "scripts/",
+        "tools/",
+        "**/__pycache__",
+        "**/.pytest_cache"
+    ],
+    "pythonVersion": "3.12",
+    "pythonPlatform": "Linux"
+}
+
+# Serializados uma única vez na importação do módulo
+_VSCODE_SETTINGS_BYTES = json.dumps(_VSCODE_SETTINGS, indent=4).encode('utf-8')
+_PYRIGHT_CFG_BYTES = json.dumps(_PYRIGHT_CONFIG, indent=4).encode('utf-8')
+
+# (caminho, conteúdo já codificado, anexar ao invés de sobrescrever)
+FileTask = Tuple[Path, bytes, bool]
+
+
+def _write_task(task: FileTask) -> Path:
+    """Grava uma tarefa de arquivo com uma única escrita"""
+    path, data, append = task
+    if append:
+        with open(path, 'ab') as f:
+            f.write(data)
+    else:
+        path.write_bytes(data)
+    return path
+
+
+def create_comprehensive_gitignore() -> List[FileTask]:
     """Atualiza .gitignore para ignorar arquivos que causam warnings"""
     gitignore_additions = """
 # === SUPRESSÃO DE WARNINGS ===
@@ -37,13 +136,10 @@ pyrightconfig.json.bak
 **/tools/**/*.pyc
 """
 
-    with open('.gitignore', 'a', encoding='utf-8') as f:
-        f.write(gitignore_additions)
+    return [(Path('.gitignore'), gitignore_additions.encode('utf-8'), True)]
 
-    print("✅ .gitignore atualizado para suprimir warnings")
 
-
-def create_pylance_disable_file():
+def create_pylance_disable_file() -> List[FileTask]:
     """Cria arquivo para desabilitar completamente o Pylance em diretórios específicos"""
     disable_content = """# Pylance Disabled
 # Este arquivo desabilita a análise do Pylance neste diretório
@@ -52,64 +148,24 @@ def create_pylance_disable_file():
     # Diretórios onde desabilitar análise
     dirs_to_disable = ['examples', 'scripts', 'tools']
 
-    for dir_name in dirs_to_disable:
-        if os.path.exists(dir_name):
-            disable_path = os.path.join(dir_name, '.pylanceignore')
-            with open(disable_path, 'w', encoding='utf-8') as f:
-                f.write(disable_content)
-            print(f"✅ Pylance desabilitado em {dir_name}/")
+    data = disable_content.encode('utf-8')
+    return [
+        (Path(dir_name) / '.pylanceignore', data, False)
+        for dir_name in dirs_to_disable
+        if Path(dir_name).is_dir()
+    ]
 
 
-def update_vscode_settings():
+def update_vscode_settings() -> List[FileTask]:
     """Atualiza configurações do VS Code para eliminar warnings"""
-    vscode_dir = '.vscode'
-    if not os.path.exists(vscode_dir):
-        os.makedirs(vscode_dir)
-
-    # Configurações mais agressivas para eliminar warnings
-    settings = {
-        "python.analysis.typeCheckingMode": "o",
-        "python.analysis.autoImportCompletions": False,
-        "python.analysis.diagnosticMode": "openFilesOnly",
-        "python.linting.enabled": False,
-        "python.analysis.logLevel": "Error",
-        "python.analysis.useLibraryCodeForTypes": False,
-        "python.analysis.stubPath": "",
-        "python.analysis.extraPaths": [],
-        "python.analysis.exclude": [
-            "**/examples/**",
-            "**/scripts/**",
-            "**/tools/**",
-            "**/__pycache__/**",
-            "**/.pytest_cache/**"
-        ],
-        "files.associations": {
-            "*.py": "python"
-        },
-        "python.defaultInterpreterPath": "./.venv/bin/python",
-        "markdownlint.config": {
-            "MD009": False,
-            "MD026": False,
-            "MD030": False,
-            "MD050": False,
-            "MD040": False,
-            "MD022": False,
-            "MD034": False,
-            "MD033": False,
-            "MD032": False,
-            "MD031": False,
-            "MD036": False
-        }
-    }
+    vscode_dir = Path('.vscode')
+    vscode_dir.mkdir(parents=True, exist_ok=True)
 
-    settings_path = os.path.join(vscode_dir, 'settings.json')
-    with open(settings_path, 'w', encoding='utf-8') as f:
-        json.dump(settings, f, indent=4)
+    settings_path = vscode_dir / 'settings.json'
+    return [(settings_path, _VSCODE_SETTINGS_BYTES, False)]
 
-    print("✅ Configurações do VS Code atualizadas para eliminar warnings")
 
-
-def create_pyproject_toml():
+def create_pyproject_toml() -> List[FileTask]:
     """Cria pyproject.toml com configurações para suprimir warnings"""
     content = """[tool.pyright]
 typeCheckingMode = "o"
@@ -163,60 +219,12 @@ profile = "black"
 line_length = 120
 """
 
-    with open('pyproject.toml', 'w', encoding='utf-8') as f:
-        f.write(content)
-
-    print("✅ pyproject.toml criado para suprimir warnings")
+    return [(Path('pyproject.toml'), content.encode('utf-8'), False)]
 
 
-def create_pyrightconfig():
+def create_pyrightconfig() -> List[FileTask]:
     """Cria pyrightconfig.json otimizado para zero warnings"""
-    config = {
-        "typeCheckingMode": "o",
-        "reportGeneralTypeIssues": "none",
-        "reportMissingImports": "none",
-        "reportMissingTypeStubs": False,
-        "reportOptionalMemberAccess": "none",
-        "reportOptionalSubscript": "none",
-        "reportOptionalIterable": "none",
-        "reportAttributeAccessIssue": "none",
-        "reportCallIssue": "none",
-        "reportArgumentType": "none",
-        "reportAssignmentType": "none",
-        "reportOperatorIssue": "none",
-        "reportIndexIssue": "none",
-        "reportPrivateUsage": "none",
-        "reportUnknownParameterType": "none",
-        "reportUnknownVariableType": "none",
-        "reportUnknownMemberType": "none",
-        "reportUnknownArgumentType": "none",
-        "reportMissingParameterType": "none",
-        "reportMissingReturnType": "none",
-        "reportUntypedFunctionDecorator": "none",
-        "reportIncompatibleMethodOverride": "none",
-        "reportIncompatibleVariableOverride": "none",
-        "reportConstantRedefinition": "none",
-        "reportImportCycles": "none",
-        "reportUnusedImport": "none",
-        "reportUnusedClass": "none",
-        "reportUnusedFunction": "none",
-        "reportUnusedVariable": "none",
-        "reportDuplicateImport": "none",
-        "exclude": [
-            "examples/",
-            "scripts/",
-            "tools/",
-            "**/__pycache__",
-            "**/.pytest_cache"
-        ],
-        "pythonVersion": "3.12",
-        "pythonPlatform": "Linux"
-    }
-
-    with open('pyrightconfig.json', 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=4)
-
-    print("✅ pyrightconfig.json otimizado para zero warnings")
+    return [(Path('pyrightconfig.json'), _PYRIGHT_CFG_BYTES, False)]
 
 
 def main():
@@ -225,11 +233,24 @@ def main():
     print()
 
     try:
-        create_comprehensive_gitignore()
-        create_pylance_disable_file()
-        update_vscode_settings()
-        create_pyproject_toml()
-        create_pyrightconfig()
+        tasks: List[FileTask] = []
+        tasks += create_comprehensive_gitignore()
+        pylance_tasks = create_pylance_disable_file()
+        tasks += pylance_tasks
+        tasks += update_vscode_settings()
+        tasks += create_pyproject_toml()
+        tasks += create_pyrightconfig()
+
+        # Arquivos independentes: gravar em paralelo
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            list(executor.map(_write_task, tasks))
+
+        print("✅ .gitignore atualizado para suprimir warnings")
+        for path, _, _ in pylance_tasks:
+            print(f"✅ Pylance desabilitado em {path.parent}/")
+        print("✅ Configurações do VS Code atualizadas para eliminar warnings")
+        print("✅ pyproject.toml criado para suprimir warnings")
+        print("✅ pyrightconfig.json otimizado para zero warnings")
 
         print()
         print("🎉 CONCLUÍDO! Configurações aplicadas para eliminar warnings:")
@@ -21,18 +21,120 @@ import sys
 import traceback
 import functools
 import logging
+import random
 import time
-from typing import Any, Callable, Optional, Dict
-from datetime import datetime
+from typing import Any, Callable, Optional, Dict, List
+from datetime import datetime, timezone
+import codecs
 import json
+import re
+import reprlib
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+try:
+    import requests
+except ImportError:  # requests só é necessário para RobustAPIClient
+    requests = None
+
+try:
+    import orjson
+
+    def _dumps(data: Dict[str, Any]) -> str:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+except ImportError:  # orjson é opcional; json da stdlib como fallback
+    def _dumps(data: Dict[str, Any]) -> str:
+        return json.dumps(data, default=str)
+
+# Padrões pré-compilados usados por implement_error_handling_in_module
+_HEADER_RE = re.compile(r'^[ \t]*(?:(""".*""")|import\s|from\s)', re.M)
+_EXISTING_IMP_RE = re.compile(
+    r'^\s*(?:import\s+(logging|traceback)\b|from\s+(typing|datetime)\s+import)', re.M
+)
+
+# Configuração de logging inserida logo após os imports do módulo
+_LOGGING_CONFIG = [
+    "",
+    "# Configuração de logging robusto",
+    "logger = logging.getLogger(__name__)",
+    "if not logger.handlers:",
+    "    handler = logging.StreamHandler()",
+    "    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')",
+    "    handler.setFormatter(formatter)",
+    "    logger.addHandler(handler)",
+    "    logger.setLevel(logging.INFO)",
+    ""
+]
+
+# repr limitado para argumentos nos logs de erro (evita __repr__ enormes)
+_ARGS_REPR = reprlib.Repr()
+_ARGS_REPR.maxstring = 80
+_ARGS_REPR.maxother = 80
+_ARGS_REPR.maxlist = 5
+_ARGS_REPR.maxdict = 5
+
+# Timestamp em cache: o prefixo ISO só é reformatado quando o segundo muda
+_TS_SEC = 0
+_TS_STR = ""
+
+
+def _iso_now() -> str:
+    """Timestamp ISO 8601 (UTC, milissegundos) sem construir datetime a cada chamada"""
+    global _TS_SEC, _TS_STR
+    t = time.time_ns()
+    sec = t // 1_000_000_000
+    if sec != _TS_SEC:
+        _TS_SEC = sec
+        _TS_STR = datetime.fromtimestamp(sec, timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
+    return f"{_TS_STR}.{(t // 1_000_000) % 1000:03d}Z"
+
 
 # Configurar logging estruturado
 
 
+class _LazyJson:
+    """Serializa o payload em JSON apenas quando o registro é formatado"""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+
+    def __str__(self) -> str:
+        return _dumps(self.data)
+
+
 class StructuredLogger:
-    """Logger estruturado para erros e eventos"""
+    """Logger estruturado para erros e eventos
+
+    Uma única instância por ``module_name``: chamadas repetidas ao construtor
+    devolvem o mesmo objeto, e o handler é configurado apenas uma vez.
+    """
+
+    _instances: Dict[str, "StructuredLogger"] = {}
+    # Módulos são processados em paralelo (ThreadPoolExecutor em main)
+    _lock = threading.Lock()
+
+    def __new__(cls, module_name: str):
+        with cls._lock:
+            instance = cls._instances.get(module_name)
+            if instance is None:
+                instance = super().__new__(cls)
+                cls._instances[module_name] = instance
+        return instance
 
     def __init__(self, module_name: str):
+        if getattr(self, "_initialized", False):
+            return
+
+        with self._lock:
+            if not getattr(self, "_initialized", False):
+                self._setup(module_name)
+
+    def _setup(self, module_name: str):
+        """Configura o logger (chamado uma vez por instância, sob _lock)"""
         self.module_name = module_name
         self.logger = logging.getLogger(module_name)
 
@@ -46,49 +148,71 @@ class StructuredLogger:
             self.logger.addHandler(handler)
             self.logger.setLevel(logging.INFO)
 
+        self._initialized = True
+
     def log_error(self, error: Exception, context: Dict[str, Any] = None):
-        """Log estruturado de erro"""
+        """Log estruturado de erro
+
+        Retorna None sem montar o payload quando o nível ERROR está filtrado.
+        """
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return None
+
         error_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _iso_now(),
             "module": self.module_name,
             "error_type": type(error).__name__,
             "error_message": str(error),
-            "traceback": traceback.format_exc(),
+            "traceback": traceback.format_exc() if sys.exc_info()[0] is not None else None,
             "context": context or {}
         }
 
-        self.logger.error(json.dumps(error_data, indent=2))
+        self.logger.error("%s", _LazyJson(error_data))
         return error_data
 
     def log_recovery(self, action: str, success: bool, details: Dict[str, Any] = None):
         """Log de tentativas de recovery"""
+        level = logging.INFO if success else logging.WARNING
+        if not self.logger.isEnabledFor(level):
+            return None
+
         recovery_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _iso_now(),
             "module": self.module_name,
             "recovery_action": action,
             "success": success,
             "details": details or {}
         }
 
-        level = logging.INFO if success else logging.WARNING
-        self.logger.log(level, json.dumps(recovery_data, indent=2))
+        self.logger.log(level, "%s", _LazyJson(recovery_data))
         return recovery_data
 
 
-def robust_operation(max_retries: int = 3, delay: float = 1.0, fallback_value: Any = None):
+MAX_BACKOFF = 30.0
+
+
+def robust_operation(max_retries: int = 3, delay: float = 1.0, fallback_value: Any = None,
+                     max_backoff: float = MAX_BACKOFF):
     """
     Decorator para operações robustas com retry automático
 
+    O intervalo entre tentativas cresce exponencialmente
+    (delay, 2*delay, 4*delay, ...), limitado a ``max_backoff`` e multiplicado
+    por um jitter aleatório entre 0.5 e 1.5 para evitar retries sincronizados.
+
     Args:
         max_retries: Número máximo de tentativas
-        delay: Delay entre tentativas (segundos)
+        delay: Delay base entre tentativas (segundos)
         fallback_value: Valor retornado em caso de falha total
+        max_backoff: Delay máximo entre tentativas antes do jitter (segundos)
     """
     def decorator(func: Callable) -> Callable:
+        # Metadados resolvidos uma vez, fora do caminho quente do wrapper
+        func_name = func.__name__
+        logger = StructuredLogger(func.__module__ or "unknown")
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            logger = StructuredLogger(func.__module__ or "unknown")
-
             for attempt in range(max_retries + 1):
                 try:
                     result = func(*args, **kwargs)
@@ -96,7 +220,7 @@ def robust_operation(max_retries: int = 3, delay: float = 1.0, fallback_value: A
                     # Log sucesso se houve tentativas anteriores
                     if attempt > 0:
                         logger.log_recovery(
-                            f"{func.__name__}_retry",
+                            f"{func_name}_retry",
                             True,
                             {"attempt": attempt + 1, "total_attempts": max_retries + 1}
                         )
@@ -104,24 +228,27 @@ def robust_operation(max_retries: int = 3, delay: float = 1.0, fallback_value: A
                     return result
 
                 except Exception as e:
-                    error_context = {
-                        "function": func.__name__,
-                        "attempt": attempt + 1,
-                        "max_retries": max_retries + 1,
-                        "args": str(args)[:200],  # Limitar tamanho do log
-                        "kwargs": str(kwargs)[:200]
-                    }
-
-                    logger.log_error(e, error_context)
+                    # Contexto só é montado se o registro de erro for emitido
+                    if logger.logger.isEnabledFor(logging.ERROR):
+                        error_context = {
+                            "function": func_name,
+                            "attempt": attempt + 1,
+                            "max_retries": max_retries + 1,
+                            "args": _ARGS_REPR.repr(args),  # Limitar tamanho do log
+                            "kwargs": _ARGS_REPR.repr(kwargs)
+                        }
+
+                        logger.log_error(e, error_context)
 
                     # Se não é a última tentativa, aguardar e tentar novamente
                     if attempt < max_retries:
-                        time.sleep(delay * (attempt + 1))  # Backoff exponencial
+                        # Backoff exponencial com jitter
+                        time.sleep(min(max_backoff, delay * (1 << attempt)) * random.uniform(0.5, 1.5))
                         continue
 
                     # Última tentativa falhou
                     logger.log_recovery(
-                        f"{func.__name__}_final_failure",
+                        f"{func_name}_final_failure",
                         False,
                         {"fallback_value": str(fallback_value)}
                     )
@@ -145,15 +272,18 @@ def safe_execution(fallback_value: Any = None, log_errors: bool = True):
         log_errors: Se deve logar erros
     """
     def decorator(func: Callable) -> Callable:
+        # Metadados resolvidos uma vez, fora do caminho quente do wrapper
+        func_name = func.__name__
+        logger = StructuredLogger(func.__module__ or "unknown")
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
                 if log_errors:
-                    logger = StructuredLogger(func.__module__ or "unknown")
                     logger.log_error(e, {
-                        "function": func.__name__,
+                        "function": func_name,
                         "safe_execution": True,
                         "fallback_value": str(fallback_value)
                     })
@@ -172,6 +302,11 @@ class RobustDatabase:
         self.connection_retries = 0
         self.max_connection_retries = 5
 
+        # Cache do health check (resultado válido por _hc_ttl segundos)
+        self._hc_last = 0.0
+        self._hc_val = False
+        self._hc_ttl = 5.0
+
     @robust_operation(max_retries=3, delay=1.0)
     def execute_query(self, query: str, params: tuple = None):
         """Execução robusta de query"""
@@ -182,14 +317,24 @@ class RobustDatabase:
         """Conexão robusta com banco"""
         return self.db.get_connection()
 
-    @safe_execution(fallback_value=False)
     def health_check(self) -> bool:
-        """Health check do banco de dados"""
+        """Health check do banco de dados
+
+        Consulta o banco diretamente, sem o retry de ``execute_query``, e
+        reaproveita o último resultado por ``_hc_ttl`` segundos.
+        """
+        now = time.monotonic()
+        if self._hc_last and now - self._hc_last < self._hc_ttl:
+            return self._hc_val
+
         try:
-            self.execute_query("SELECT 1")
-            return True
+            self.db.execute_query("SELECT 1")
+            self._hc_val = True
         except Exception:
-            return False
+            self._hc_val = False
+
+        self._hc_last = now
+        return self._hc_val
 
 
 class RobustAPIClient:
@@ -199,21 +344,25 @@ class RobustAPIClient:
         self.base_url = base_url
         self.logger = StructuredLogger("RobustAPIClient")
         self.offline_mode = False
+        # Sessão reutilizada para manter a conexão HTTP viva entre requests
+        self._session = requests.Session() if requests is not None else None
 
     @robust_operation(max_retries=3, delay=2.0)
     def make_request(self, endpoint: str, method: str = "GET", data: dict = None):
         """Request robusto para API"""
-        import requests
+        if self._session is None:
+            raise ImportError("requests não instalado")
 
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
 
-        if method.upper() == "GET":
-            response = requests.get(url, timeout=10)
-        elif method.upper() == "POST":
-            response = requests.post(url, json=data, timeout=10)
-        else:
+        method = method.upper()
+        if method not in ("GET", "POST"):
             raise ValueError(f"Método não suportado: {method}")
 
+        response = self._session.request(
+            method, url, json=data if method == "POST" else None, timeout=10
+        )
+
         response.raise_for_status()
         return response.json()
 
@@ -228,20 +377,43 @@ class RobustAPIClient:
             return {"status": "offline", "error": str(e)}
 
 
+def _has_handlers(module_path: str, chunk_size: int = 65536) -> bool:
+    """Verifica se o módulo contém 'try:' e 'except' lendo o arquivo em blocos
+
+    A ordem dos dois não importa. Retorna assim que encontra ambos, sem
+    carregar o arquivo inteiro.
+    """
+    saw_try = saw_except = False
+    tail = b""
+    with open(module_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            # Sobreposição com o bloco anterior cobre tokens divididos na fronteira
+            data = tail + chunk
+            saw_try = saw_try or b'try:' in data
+            saw_except = saw_except or b'except' in data
+            if saw_try and saw_except:
+                return True
+            tail = data[-5:]
+    return False
+
+
 def implement_error_handling_in_module(module_path: str):
     """Implementa tratamento de erros em um módulo específico"""
 
     logger = StructuredLogger("ErrorHandlingImplementer")
 
     try:
-        with open(module_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Verificar se já tem tratamento de erros
-        if 'try:' in content and 'except' in content:
-            logger.logger.info(f"Módulo {module_path} já tem tratamento de erros")
+        # Verificar se já tem tratamento de erros (leitura em blocos)
+        if _has_handlers(module_path):
+            logger.logger.info("Módulo %s já tem tratamento de erros", module_path)
             return True
 
+        # Ler bytes uma única vez; BOM e quebras de linha são preservados na escrita
+        raw = Path(module_path).read_bytes()
+        bom = codecs.BOM_UTF8 if raw.startswith(codecs.BOM_UTF8) else b""
+        content = raw[len(bom):].decode('utf-8')
+        newline = '\r\n' if '\r\n' in content else '\n'
+
         # Adicionar imports necessários
         imports_to_add = [
             "import logging",
@@ -250,54 +422,32 @@ def implement_error_handling_in_module(module_path: str):
             "from datetime import datetime"
         ]
 
-        # Verificar quais imports já existem
-        existing_imports = []
-        for imp in imports_to_add:
-            if imp.split()[-1] in content:
-                existing_imports.append(imp)
-
-        new_imports = [imp for imp in imports_to_add if imp not in existing_imports]
+        # Verificar quais imports já existem (uma única passada no conteúdo)
+        found = {g for m in _EXISTING_IMP_RE.finditer(content) for g in m.groups() if g}
+        new_imports = [imp for imp in imports_to_add if imp.split()[1] not in found]
 
         if new_imports:
+            # Encontrar onde inserir imports: após uma docstring de uma linha
+            # ou antes do primeiro import, sem percorrer o arquivo linha a linha
+            insert_line = 0
+            match = _HEADER_RE.search(content)
+            if match:
+                insert_line = content.count('\n', 0, match.start())
+                if match.group(1):
+                    insert_line += 1
+
             # Adicionar imports no início do arquivo
-            lines = content.split('\n')
+            lines = content.split(newline)
 
-            # Encontrar onde inserir imports
-            insert_line = 0
-            for i, line in enumerate(lines):
-                if line.strip().startswith('"""') and '"""' in line[3:]:
-                    insert_line = i + 1
-                    break
-                elif line.strip().startswith('import') or line.strip().startswith('from'):
-                    insert_line = i
-                    break
-
-            # Inserir imports
-            for imp in reversed(new_imports):
-                lines.insert(insert_line, imp)
-
-            # Adicionar configuração de logging
-            logging_config = [
-                "",
-                "# Configuração de logging robusto",
-                "logger = logging.getLogger(__name__)",
-                "if not logger.handlers:",
-                "    handler = logging.StreamHandler()",
-                "    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')",
-                "    handler.setFormatter(formatter)",
-                "    logger.addHandler(handler)",
-                "    logger.setLevel(logging.INFO)",
-                ""
-            ]
-
-            for line in reversed(logging_config):
-                lines.insert(insert_line + len(new_imports), line)
-
-            # Salvar arquivo modificado
-            with open(module_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(lines))
-
-            logger.logger.info(f"✅ Tratamento de erros adicionado a {module_path}")
+            # Inserir imports e configuração em uma única operação
+            lines[insert_line:insert_line] = new_imports + _LOGGING_CONFIG
+
+            # Salvar arquivo modificado apenas se o conteúdo mudou
+            new_bytes = bom + newline.join(lines).encode('utf-8')
+            if new_bytes != raw:
+                Path(module_path).write_bytes(new_bytes)
+
+            logger.logger.info("✅ Tratamento de erros adicionado a %s", module_path)
             return True
 
     except Exception as e:
@@ -305,6 +455,29 @@ def implement_error_handling_in_module(module_path: str):
         return False
 
 
+CACHE_FILE = ".maintenance_cache.json"
+
+
+def _load_cache(cache_path: Path) -> Dict[str, List[int]]:
+    """Carrega o cache path -> [mtime_ns, size] de módulos já processados"""
+    try:
+        return json.loads(cache_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache_path: Path, cache: Dict[str, List[int]]):
+    """Grava o cache de forma atômica (arquivo temporário + rename)"""
+    fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
 def main():
     """Implementa tratamento de erros em todos os módulos"""
 
@@ -325,19 +498,52 @@ def main():
 
     success_count = 0
 
+    # Cache mtime+size: módulos inalterados desde a última execução são pulados
+    cache_path = Path(src_dir) / CACHE_FILE
+    cache = _load_cache(cache_path)
+    cache_dirty = False
+
+    pending = []
     for module in critical_modules:
         module_path = os.path.join(src_dir, module)
 
-        if os.path.exists(module_path):
-            print(f"\n🔧 Processando: {module}")
-
-            if implement_error_handling_in_module(module_path):
-                success_count += 1
-                print("   ✅ Sucesso")
-            else:
-                print("   ❌ Falha")
-        else:
+        try:
+            st = os.stat(module_path)
+        except FileNotFoundError:
             print(f"\n⚠️ Módulo não encontrado: {module}")
+            continue
+
+        if cache.get(module_path) == [st.st_mtime_ns, st.st_size]:
+            success_count += 1
+            print(f"\n⏭️ {module}: inalterado (cache)")
+            continue
+
+        pending.append((module, module_path))
+
+    # Módulos independentes e limitados por I/O: processar em paralelo
+    print_lock = threading.Lock()
+
+    def process(module: str, module_path: str) -> bool:
+        ok = bool(implement_error_handling_in_module(module_path))
+        with print_lock:
+            print(f"\n🔧 Processando: {module}")
+            print("   ✅ Sucesso" if ok else "   ❌ Falha")
+        return ok
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+            futures = {executor.submit(process, module, module_path): module_path
+                       for module, module_path in pending}
+            for future in as_completed(futures):
+                if future.result():
+                    module_path = futures[future]
+                    success_count += 1
+                    st = os.stat(module_path)
+                    cache[module_path] = [st.st_mtime_ns, st.st_size]
+                    cache_dirty = True
+
+    if cache_dirty and cache_path.parent.is_dir():
+        _save_cache(cache_path, cache)
 
     print("\n📊 RESULTADO:")
     print(f"   ✅ Módulos processados: {success_count}/{len(critical_modules)}")
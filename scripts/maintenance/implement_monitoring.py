@@ -18,26 +18,94 @@ import asyncio
 import logging
 import time
 import json
+import re
+import sqlite3
+import numpy as np
 import psutil
-import requests
+import aiohttp
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from urllib.parse import urlsplit
+from dataclasses import dataclass
 import threading
+import queue
 import sys
 import os
+from collections import Counter
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:  # inotify_simple é opcional (somente Linux)
+    INotify = None
 
 # Adicionar src ao path
 sys.path.append('/home/brendo/lore/src')
 
 
+try:
+    import orjson
+
+    def _dump_report(report: Dict[str, Any], pretty: bool = False) -> bytes:
+        """Serializa relatório (datetime e dataclasses nativos no orjson)"""
+        return orjson.dumps(report, default=str, option=orjson.OPT_INDENT_2 if pretty else 0)
+except ImportError:  # orjson é opcional; json da stdlib como fallback
+    def _dump_report(report: Dict[str, Any], pretty: bool = False) -> bytes:
+        """Serializa relatório com a biblioteca padrão"""
+        return json.dumps(report, indent=2 if pretty else None, default=str).encode('utf-8')
+
+# Linhas do log do universo que mencionam agentes, e números dentro delas
+_AGENTS_LINE_RE = re.compile(rb'^[^\n]*(?:agentes|agents)[^\n]*', re.I | re.M)
+_NUMBER_RE = re.compile(rb'\d+')
+
+# Status de componente -> status geral, em ordem de precedência
+_STATUS_PRECEDENCE = (
+    ("critical", "critical"),
+    ("warning", "warning"),
+    ("offline", "degraded"),
+)
+
+# Timeout (s) das requisições HTTP dos health checks. O limite externo de
+# api_server/dashboard em SystemMonitor fica acima dele, para que o próprio
+# check trate o timeout e informe o status
+HTTP_CHECK_TIMEOUT = 4.0
+
+# Intervalo (s) entre verificações HTTP completas do dashboard; nos demais
+# ciclos basta um probe TCP
+DASHBOARD_HTTP_INTERVAL = 300
+
+# Tempo (s) até um mesmo conjunto de falhas críticas ser alertado novamente
+ALERT_TTL = 24 * 3600
+
+# Banco de dados persistente do universo
+DB_PATH = "/home/brendo/lore/data/lore_persistent_universe.db"
+
+# Amostras de métricas mantidas em memória (24h com coletas a cada 30s)
+METRICS_HISTORY_SIZE = 2880
+
+# Registro compacto de uma amostra de SystemMetrics (timestamp em segundos epoch)
+_METRIC_DTYPE = np.dtype([
+    ('ts', 'i8'),
+    ('cpu', 'f4'),
+    ('mem', 'f4'),
+    ('disk', 'f4'),
+    ('proc_cpu', 'f4'),
+    ('proc_mem_mb', 'f4'),
+    ('agents', 'i4'),
+    ('db', 'i4'),
+    ('reqpm', 'i4'),
+    ('nweb', 'i4'),
+])
+
+# Bytes lidos do final do log do universo a cada verificação
+LOG_TAIL_BYTES = 64 * 1024
+
 # Configurar logging
 setup_global_error_handling()
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthStatus:
     """Status de saúde de um componente"""
     component: str
@@ -47,8 +115,19 @@ class HealthStatus:
     details: Dict[str, Any]
     error_message: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Dicionário raso (``details`` por referência, sem cópia profunda)"""
+        return {
+            "component": self.component,
+            "status": self.status,
+            "response_time": self.response_time,
+            "last_check": self.last_check,
+            "details": self.details,
+            "error_message": self.error_message,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class SystemMetrics:
     """Métricas do sistema"""
     timestamp: datetime
@@ -59,6 +138,23 @@ class SystemMetrics:
     database_connections: int
     api_requests_per_minute: int
     neural_web_connections: int
+    process_cpu_percent: float = 0.0
+    process_memory_mb: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dicionário com os campos das métricas"""
+        return {
+            "timestamp": self.timestamp,
+            "cpu_percent": self.cpu_percent,
+            "memory_percent": self.memory_percent,
+            "disk_percent": self.disk_percent,
+            "active_agents": self.active_agents,
+            "database_connections": self.database_connections,
+            "api_requests_per_minute": self.api_requests_per_minute,
+            "neural_web_connections": self.neural_web_connections,
+            "process_cpu_percent": self.process_cpu_percent,
+            "process_memory_mb": self.process_memory_mb,
+        }
 
 
 class HealthChecker:
@@ -66,8 +162,103 @@ class HealthChecker:
 
     def __init__(self):
         self.logger = logging.getLogger("HealthChecker")
-        self.checks = {}
-        self.alerts_sent = set()
+        # nome -> [fábrica da coroutine, intervalo (s), última execução (monotonic), último status]
+        self.checks: Dict[str, List[Any]] = {
+            "database": [self.check_database, 120.0, 0.0, None],
+            "api_server": [self.check_api_server, 30.0, 0.0, None],
+            "dashboard": [self.check_dashboard, 60.0, 0.0, None],
+            "system_resources": [self.check_system_resources, 30.0, 0.0, None],
+            "universe_status": [self.check_universe_status, 30.0, 0.0, None],
+        }
+        # chave do conjunto de falhas -> expiração (time.monotonic)
+        self.alerts_sent: Dict[tuple, float] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._db_conn: Optional[sqlite3.Connection] = None
+        self._dashboard_http_last = 0.0
+
+        # Leitura incremental do log do universo
+        self._log_offset = 0
+        self._estimated_agents = 0
+        self._inotify = None
+
+        # Snapshot do psutil compartilhado com SystemMonitor.collect_system_metrics
+        self._psutil_cache: Dict[str, Any] = {"ts": 0.0, "data": None}
+        psutil.cpu_percent(interval=None)  # Primeira chamada só inicializa o contador
+
+    def sample_resources(self, min_interval: float = 5.0) -> Dict[str, Any]:
+        """Amostra CPU, memória e disco, reaproveitando a amostra recente
+
+        ``cpu_percent(interval=None)`` não bloqueia: mede o uso desde a
+        chamada anterior.
+        """
+        now = time.monotonic()
+        cache = self._psutil_cache
+        if cache["data"] is None or now - cache["ts"] >= min_interval:
+            cache["data"] = {
+                "cpu_percent": psutil.cpu_percent(interval=None),
+                "memory": psutil.virtual_memory(),
+                "disk": psutil.disk_usage('/'),
+            }
+            cache["ts"] = now
+        return cache["data"]
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Sessão HTTP compartilhada entre ciclos (criada no primeiro uso)"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=HTTP_CHECK_TIMEOUT))
+        return self._session
+
+    def _log_changed(self, log_dir: Path, log_name: str, size: int) -> bool:
+        """Indica se o log do universo recebeu escrita desde a última leitura
+
+        Usa inotify quando disponível; caso contrário compara o tamanho atual
+        com o offset já lido.
+        """
+        if INotify is None:
+            return size != self._log_offset
+
+        if self._inotify is None:
+            try:
+                self._inotify = INotify()
+                self._inotify.add_watch(str(log_dir), inotify_flags.MODIFY | inotify_flags.CREATE)
+            except OSError:
+                self._inotify = None
+                return size != self._log_offset
+            return True  # Watch recém-criado: ler o estado atual uma vez
+
+        return any(event.name == log_name for event in self._inotify.read(timeout=0))
+
+    def _read_new_log_bytes(self, log_path: Path, size: int) -> bytes:
+        """Lê os bytes anexados ao log desde o último offset (no máximo LOG_TAIL_BYTES)"""
+        # Arquivo truncado/rotacionado: recomeçar do início
+        start = self._log_offset if size >= self._log_offset else 0
+        start = max(start, size - LOG_TAIL_BYTES)
+
+        with open(log_path, 'rb') as f:
+            f.seek(start)
+            data = f.read(size - start)
+
+        self._log_offset = start + len(data)
+        return data
+
+    def _close_db(self):
+        """Fecha a conexão SQLite reaproveitada, se houver"""
+        if self._db_conn is not None:
+            try:
+                self._db_conn.close()
+            except sqlite3.Error:
+                pass
+            self._db_conn = None
+
+    async def close(self):
+        """Fecha a sessão HTTP compartilhada e a conexão com o banco"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._close_db()
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
 
     async def check_database(self) -> HealthStatus:
         """Verifica saúde do banco de dados"""
@@ -75,9 +266,11 @@ class HealthChecker:
 
         try:
             # Verificar se arquivo de banco existe
-            db_path = "/home/brendo/lore/data/lore_persistent_universe.db"
+            db_path = DB_PATH
 
-            if not os.path.exists(db_path):
+            try:
+                db_stat = os.stat(db_path)
+            except FileNotFoundError:
                 return HealthStatus(
                     component="database",
                     status="critical",
@@ -87,17 +280,21 @@ class HealthChecker:
                     error_message=f"Database file missing: {db_path}"
                 )
 
-            # Verificar tamanho do arquivo
-            db_size = os.path.getsize(db_path)
-
-            # Tentar conectar via sqlite3
-            import sqlite3
+            # Tamanho do arquivo vem do mesmo stat
+            db_size = db_stat.st_size
 
-            conn = sqlite3.connect(db_path, timeout=5)
-            cursor = conn.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = cursor.fetchall()
-            conn.close()
+            # Consultar via conexão somente-leitura reaproveitada entre ciclos
+            try:
+                if self._db_conn is None:
+                    self._db_conn = sqlite3.connect(
+                        f"file:{db_path}?mode=ro", uri=True, timeout=5, check_same_thread=False
+                    )
+                tables = self._db_conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table'"
+                ).fetchall()
+            except sqlite3.Error:
+                self._close_db()  # Reabrir no próximo ciclo
+                raise
 
             response_time = time.time() - start_time
 
@@ -131,28 +328,31 @@ class HealthChecker:
         start_time = time.time()
 
         try:
-            response = requests.get(f"{base_url}/health", timeout=10)
+            async with self._get_session().get(f"{base_url}/health") as response:
+                if response.content_type == 'application/json':
+                    body = await response.json()
+                else:
+                    body = (await response.text())[:200]
             response_time = time.time() - start_time
 
-            if response.status_code == 200:
+            if response.status == 200:
                 return HealthStatus( component="api_server",
                                      status="healthy",
                                      response_time=response_time,
                                      last_check=datetime.now(),
-                                     details={ "status_code": response.status_code,
-                                               "response": response.json() if response.headers.get('content-type',
-                                                                                                   '').startswith('application/json') else response.text[:200] } )
+                                     details={ "status_code": response.status,
+                                               "response": body } )
             else:
                 return HealthStatus(
                     component="api_server",
                     status="warning",
                     response_time=response_time,
                     last_check=datetime.now(),
-                    details={"status_code": response.status_code},
-                    error_message=f"HTTP {response.status_code}"
+                    details={"status_code": response.status},
+                    error_message=f"HTTP {response.status}"
                 )
 
-        except requests.exceptions.ConnectionError:
+        except aiohttp.ClientConnectorError:
             response_time = time.time() - start_time
             return HealthStatus(
                 component="api_server",
@@ -163,6 +363,17 @@ class HealthChecker:
                 error_message="API server is offline"
             )
 
+        except asyncio.TimeoutError:
+            response_time = time.time() - start_time
+            return HealthStatus(
+                component="api_server",
+                status="critical",
+                response_time=response_time,
+                last_check=datetime.now(),
+                details={"error": "timeout"},
+                error_message="timeout"
+            )
+
         except Exception as e:
             response_time = time.time() - start_time
             self.logger.error(f"API health check failed: {e}")
@@ -177,20 +388,64 @@ class HealthChecker:
             )
 
     async def check_dashboard(self, base_url: str = "http://localhost:8501") -> HealthStatus:
-        """Verifica saúde do dashboard"""
+        """Verifica saúde do dashboard
+
+        Na maioria dos ciclos basta confirmar que a porta aceita conexões TCP;
+        um GET HTTP completo é feito a cada DASHBOARD_HTTP_INTERVAL segundos.
+        """
+        now = time.monotonic()
+        if self._dashboard_http_last and now - self._dashboard_http_last < DASHBOARD_HTTP_INTERVAL:
+            return await self._probe_dashboard_tcp(base_url)
+
+        self._dashboard_http_last = now
+        return await self._check_dashboard_http(base_url)
+
+    async def _probe_dashboard_tcp(self, base_url: str) -> HealthStatus:
+        """Liveness do dashboard via conexão TCP (sem baixar a página)"""
+        start_time = time.time()
+        url = urlsplit(base_url)
+
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(url.hostname or "localhost", url.port or 80), 2.0
+            )
+            writer.close()
+            await writer.wait_closed()
+
+            return HealthStatus(
+                component="dashboard",
+                status="healthy",
+                response_time=time.time() - start_time,
+                last_check=datetime.now(),
+                details={"probe": "tcp"}
+            )
+
+        except (OSError, asyncio.TimeoutError):
+            return HealthStatus(
+                component="dashboard",
+                status="offline",
+                response_time=time.time() - start_time,
+                last_check=datetime.now(),
+                details={"probe": "tcp", "error": "Connection refused"},
+                error_message="Dashboard is offline"
+            )
+
+    async def _check_dashboard_http(self, base_url: str) -> HealthStatus:
+        """Verificação completa do dashboard via HTTP GET"""
         start_time = time.time()
 
         try:
-            response = requests.get(base_url, timeout=10)
+            async with self._get_session().get(base_url) as response:
+                status_code = response.status
             response_time = time.time() - start_time
 
-            if response.status_code == 200:
+            if status_code == 200:
                 return HealthStatus(
                     component="dashboard",
                     status="healthy",
                     response_time=response_time,
                     last_check=datetime.now(),
-                    details={"status_code": response.status_code}
+                    details={"status_code": status_code}
                 )
             else:
                 return HealthStatus(
@@ -198,11 +453,11 @@ class HealthChecker:
                     status="warning",
                     response_time=response_time,
                     last_check=datetime.now(),
-                    details={"status_code": response.status_code},
-                    error_message=f"HTTP {response.status_code}"
+                    details={"status_code": status_code},
+                    error_message=f"HTTP {status_code}"
                 )
 
-        except requests.exceptions.ConnectionError:
+        except aiohttp.ClientConnectorError:
             response_time = time.time() - start_time
             return HealthStatus(
                 component="dashboard",
@@ -213,6 +468,17 @@ class HealthChecker:
                 error_message="Dashboard is offline"
             )
 
+        except asyncio.TimeoutError:
+            response_time = time.time() - start_time
+            return HealthStatus(
+                component="dashboard",
+                status="critical",
+                response_time=response_time,
+                last_check=datetime.now(),
+                details={"error": "timeout"},
+                error_message="timeout"
+            )
+
         except Exception as e:
             response_time = time.time() - start_time
             self.logger.error(f"Dashboard health check failed: {e}")
@@ -231,9 +497,10 @@ class HealthChecker:
         start_time = time.time()
 
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            sample = self.sample_resources()
+            cpu_percent = sample["cpu_percent"]
+            memory = sample["memory"]
+            disk = sample["disk"]
 
             # Determinar status baseado nos recursos
             status = "healthy"
@@ -291,17 +558,22 @@ class HealthChecker:
             log_dir = Path("/home/brendo/lore/logs")
             autonomous_log = log_dir / "universe_autonomous.log"
 
+            # Um único stat do log responde existência e mtime
+            try:
+                log_stat = autonomous_log.stat()
+            except FileNotFoundError:
+                log_stat = None
+
             details = {
-                "log_dir_exists": log_dir.exists(),
-                "autonomous_log_exists": autonomous_log.exists(),
+                "log_dir_exists": log_stat is not None or log_dir.exists(),
+                "autonomous_log_exists": log_stat is not None,
                 "last_activity": None,
                 "estimated_agents": 0
             }
 
-            if autonomous_log.exists():
+            if log_stat is not None:
                 # Verificar atividade recente no log
-                stat = autonomous_log.stat()
-                last_modified = datetime.fromtimestamp(stat.st_mtime)
+                last_modified = datetime.fromtimestamp(log_stat.st_mtime)
                 details["last_activity"] = last_modified.isoformat()
 
                 # Determinar se há atividade recente (últimos 5 minutos)
@@ -312,21 +584,18 @@ class HealthChecker:
                 else:
                     status = "critical"
 
-                # Tentar ler últimas linhas do log para estimar agentes
+                # Estimar agentes apenas a partir dos bytes novos do log
                 try:
-                    with open(autonomous_log, 'r') as f:
-                        lines = f.readlines()
-                        # Buscar por linhas com informação de agentes
-                        for line in reversed(lines[-50:]):  # Últimas 50 linhas
-                            if "agentes" in line.lower() or "agents" in line.lower():
-                                # Tentar extrair número
-                                import re
-                                numbers = re.findall(r'\\d+', line)
-                                if numbers:
-                                    details["estimated_agents"] = int(numbers[-1])
-                                break
+                    if self._log_changed(log_dir, autonomous_log.name, log_stat.st_size):
+                        new_bytes = self._read_new_log_bytes(autonomous_log, log_stat.st_size)
+                        # Último número da última linha que menciona agentes
+                        lines = _AGENTS_LINE_RE.findall(new_bytes)
+                        numbers = _NUMBER_RE.findall(lines[-1]) if lines else None
+                        if numbers:
+                            self._estimated_agents = int(numbers[-1])
                 except Exception:
                     pass
+                details["estimated_agents"] = self._estimated_agents
             else:
                 status = "offline"
                 details["error"] = "Universe not running (no log file)"
@@ -359,13 +628,31 @@ class HealthChecker:
 class SystemMonitor:
     """Monitor principal do sistema"""
 
-    def __init__(self, check_interval: int = 30):
+    DEFAULT_CHECK_TIMEOUT = 5.0
+
+    def __init__(self, check_interval: int = 30, check_timeouts: Optional[Dict[str, float]] = None,
+                 max_check_interval: int = 300):
         self.check_interval = check_interval
+        # Health checks espaçam (até max_check_interval) enquanto tudo está saudável
+        self.max_check_interval = max_check_interval
+        self._healthy_streak = 0
+        self._next_health_check = 0.0
+        # Timeout por componente (segundos); ausentes usam DEFAULT_CHECK_TIMEOUT.
+        # Checks HTTP ganham folga sobre o timeout da sessão
+        self.check_timeouts = {
+            "api_server": HTTP_CHECK_TIMEOUT + 1,
+            "dashboard": HTTP_CHECK_TIMEOUT + 1,
+            **(check_timeouts or {}),
+        }
         self.health_checker = HealthChecker()
         self.logger = logging.getLogger("SystemMonitor")
         self.running = False
-        self.metrics_history = []
-        self.health_history = {}
+        self._proc = psutil.Process(os.getpid())
+        self._proc.cpu_percent(interval=None)  # Inicializa o contador do processo
+        # Ring buffer colunar de métricas (um registro compacto por amostra)
+        self.metrics_ring = np.zeros(METRICS_HISTORY_SIZE, dtype=_METRIC_DTYPE)
+        self._ring_i = 0
+        self._ring_count = 0
 
         # Criar diretórios necessários
         self.logs_dir = Path("/home/brendo/lore/logs")
@@ -374,16 +661,34 @@ class SystemMonitor:
         self.monitoring_log = self.logs_dir / "monitoring.log"
         self.health_report = self.logs_dir / "health_report.json"
 
+        # Histórico append-only: uma linha JSON por ciclo
+        self.health_report_jsonl = self.logs_dir / "health_report.jsonl"
+        self._history_file = None
+
+        # Escrita em disco fora do event loop: thread dedicada (iniciada a
+        # cada monitoring_cycle()) + fila limitada
+        self._write_q: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=16)
+        self._writer = None
+
+        # Task de run() quando start() é chamado dentro de um event loop
+        self._task: Optional[asyncio.Task] = None
+
     async def collect_system_metrics(self) -> SystemMetrics:
         """Coleta métricas do sistema"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            sample = self.health_checker.sample_resources()
+            cpu_percent = sample["cpu_percent"]
+            memory = sample["memory"]
+            disk = sample["disk"]
+
+            # Métricas do próprio processo lidas em lote (um parse de /proc)
+            with self._proc.oneshot():
+                process_cpu_percent = self._proc.cpu_percent(interval=None)
+                process_memory_mb = self._proc.memory_info().rss / (1024**2)
 
             # Métricas específicas do Lore (estimativas)
             active_agents = 0
-            database_connections = 1 if os.path.exists("/home/brendo/lore/data/lore_persistent_universe.db") else 0
+            database_connections = 1 if os.path.exists(DB_PATH) else 0
             api_requests_per_minute = 0  # Seria implementado com contador real
             neural_web_connections = 0  # Seria implementado com análise de log
 
@@ -395,35 +700,89 @@ class SystemMonitor:
                 active_agents=active_agents,
                 database_connections=database_connections,
                 api_requests_per_minute=api_requests_per_minute,
-                neural_web_connections=neural_web_connections
+                neural_web_connections=neural_web_connections,
+                process_cpu_percent=process_cpu_percent,
+                process_memory_mb=process_memory_mb
             )
 
         except Exception as e:
             self.logger.error(f"Failed to collect metrics: {e}")
             raise
 
+    async def _bounded(self, name: str, coro) -> HealthStatus:
+        """Executa um health check limitado pelo timeout do componente"""
+        timeout = self.check_timeouts.get(name, self.DEFAULT_CHECK_TIMEOUT)
+        start_time = time.time()
+
+        try:
+            return await asyncio.wait_for(coro, timeout=timeout)
+        except asyncio.TimeoutError:
+            return HealthStatus(
+                component=name,
+                status="critical",
+                response_time=time.time() - start_time,
+                last_check=datetime.now(),
+                details={"error": "timeout", "timeout": timeout},
+                error_message="timeout"
+            )
+
+    def record_metrics(self, metrics: SystemMetrics):
+        """Grava uma amostra no ring buffer de métricas"""
+        self.metrics_ring[self._ring_i] = (
+            int(metrics.timestamp.timestamp()),
+            metrics.cpu_percent,
+            metrics.memory_percent,
+            metrics.disk_percent,
+            metrics.process_cpu_percent,
+            metrics.process_memory_mb,
+            metrics.active_agents,
+            metrics.database_connections,
+            metrics.api_requests_per_minute,
+            metrics.neural_web_connections,
+        )
+        self._ring_i = (self._ring_i + 1) % METRICS_HISTORY_SIZE
+        self._ring_count = min(self._ring_count + 1, METRICS_HISTORY_SIZE)
+
+    def get_metrics_history(self) -> np.ndarray:
+        """Amostras registradas, da mais antiga para a mais recente"""
+        if self._ring_count < METRICS_HISTORY_SIZE:
+            return self.metrics_ring[:self._ring_count].copy()
+        return np.roll(self.metrics_ring, -self._ring_i)
+
     async def run_health_checks(self) -> Dict[str, HealthStatus]:
-        """Executa todos os health checks"""
+        """Executa os health checks cuja cadência venceu
+
+        Checks ainda dentro do intervalo reaproveitam o último status.
+        """
         checks = {}
 
         try:
-            # Executar checks em paralelo
+            now = time.monotonic()
+            due = [
+                name for name, (_, interval, last_run, last_status) in self.health_checker.checks.items()
+                if last_status is None or now - last_run >= interval
+            ]
+
+            # Executar checks em paralelo, cada um com seu timeout
             tasks = [
-                self.health_checker.check_database(),
-                self.health_checker.check_api_server(),
-                self.health_checker.check_dashboard(),
-                self.health_checker.check_system_resources(),
-                self.health_checker.check_universe_status()
+                self._bounded(name, self.health_checker.checks[name][0]())
+                for name in due
             ]
 
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            for result in results:
+            for name, result in zip(due, results):
                 if isinstance(result, HealthStatus):
-                    checks[result.component] = result
+                    entry = self.health_checker.checks[name]
+                    entry[2] = now
+                    entry[3] = result
                 elif isinstance(result, Exception):
                     self.logger.error(f"Health check failed: {result}")
 
+            for name, (_, _, _, last_status) in self.health_checker.checks.items():
+                if last_status is not None:
+                    checks[last_status.component] = last_status
+
             return checks
 
         except Exception as e:
@@ -435,25 +794,15 @@ class SystemMonitor:
 
         # Calcular status geral
         statuses = [check.status for check in checks.values()]
+        counts = Counter(statuses)
 
-        if "critical" in statuses:
-            overall_status = "critical"
-        elif "warning" in statuses:
-            overall_status = "warning"
-        elif "offline" in statuses:
-            overall_status = "degraded"
-        elif all(status == "healthy" for status in statuses):
-            overall_status = "healthy"
-        else:
-            overall_status = "unknown"
+        overall_status = next(
+            (overall for status, overall in _STATUS_PRECEDENCE if counts[status]),
+            "healthy" if counts["healthy"] == len(statuses) else "unknown"
+        )
 
         # Contadores por status
-        status_counts = {
-            "healthy": statuses.count("healthy"),
-            "warning": statuses.count("warning"),
-            "critical": statuses.count("critical"),
-            "offline": statuses.count("offline")
-        }
+        status_counts = {status: counts[status] for status in ("healthy", "warning", "critical", "offline")}
 
         # Componentes com problemas
         problematic_components = [
@@ -472,9 +821,9 @@ class SystemMonitor:
             "overall_status": overall_status,
             "status_counts": status_counts,
             "problematic_components": problematic_components,
-            "system_metrics": asdict(metrics),
+            "system_metrics": metrics.to_dict(),
             "component_details": {
-                comp: asdict(status) for comp, status in checks.items()
+                comp: status.to_dict() for comp, status in checks.items()
             },
             "uptime_score": (status_counts["healthy"] / len(statuses)) * 100 if statuses else 0
         }
@@ -488,56 +837,171 @@ class SystemMonitor:
         ]
 
         if critical_components:
-            alert_key = f"critical_{len(critical_components)}_{datetime.now().date()}"
+            # Chave pelo conteúdo: conjuntos de falhas diferentes geram alertas distintos
+            alert_key = tuple(sorted(f"{comp['component']}:{comp['error']}" for comp in critical_components))
+            alerts_sent = self.health_checker.alerts_sent
+            now = time.monotonic()
 
-            if alert_key not in self.health_checker.alerts_sent:
+            if alerts_sent.get(alert_key, 0.0) <= now:
                 self.logger.critical(f"🚨 ALERT: {len(critical_components)} critical components detected!")
 
                 for comp in critical_components:
                     self.logger.critical(f"   ❌ {comp['component']}: {comp['error']}")
 
-                self.health_checker.alerts_sent.add(alert_key)
+                # Remover alertas expirados ao inserir um novo
+                for key in [key for key, expiry in alerts_sent.items() if expiry <= now]:
+                    del alerts_sent[key]
+                alerts_sent[alert_key] = now + ALERT_TTL
+
+    def _start_writer(self):
+        """Abre o histórico e inicia a thread de escrita"""
+        self._history_file = open(self.health_report_jsonl, 'ab', buffering=0)
+        self._writer = threading.Thread(
+            target=self._writer_loop, args=(self._history_file,), daemon=True
+        )
+        self._writer.start()
+
+    def _writer_loop(self, history_file):
+        """Consome a fila de escrita até receber o sentinela None
+
+        O histórico pertence a esta thread e é fechado por ela ao sair.
+        """
+        with history_file:
+            self._drain_writes(history_file)
+
+    def _drain_writes(self, history_file):
+        """Grava os itens da fila até o sentinela None"""
+        while True:
+            item = self._write_q.get()
+            if item is None:
+                break
+
+            snapshot, history_line = item
+            try:
+                tmp_path = self.health_report.with_suffix('.json.tmp')
+                tmp_path.write_bytes(snapshot)
+                os.replace(tmp_path, self.health_report)
 
-                # Limpar alertas antigos (manter apenas do dia atual)
-                current_date = str(datetime.now().date())
-                self.health_checker.alerts_sent = {
-                    alert for alert in self.health_checker.alerts_sent
-                    if current_date in alert
-                }
+                # Manter histórico
+                history_file.write(history_line)
+            except Exception as e:
+                self.logger.error(f"Failed to save health report: {e}")
+
+    async def _stop_writer(self):
+        """Drena a fila de escrita e encerra a thread (que fecha o histórico)"""
+        if self._writer is None:
+            return
+
+        self._enqueue_write(None)
+        # join fora do event loop para não travá-lo enquanto a fila drena
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._writer.join, 10)
+        if self._writer.is_alive():
+            self.logger.warning("Health report writer still draining after 10s")
+
+        self._writer = None
+        self._history_file = None
+
+    def _enqueue_write(self, item: Optional[tuple]):
+        """Enfileira sem bloquear; com a fila cheia, descarta o item mais antigo"""
+        while True:
+            try:
+                self._write_q.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._write_q.get_nowait()
+                except queue.Empty:
+                    pass
 
     def save_health_report(self, report: Dict[str, Any]):
-        """Salva relatório de saúde"""
+        """Salva relatório de saúde
+
+        O último relatório é gravado de forma atômica em ``health_report.json``;
+        o histórico recebe uma linha em ``health_report.jsonl``. A serialização
+        ocorre aqui e a escrita fica a cargo da thread de escrita.
+        """
         try:
-            with open(self.health_report, 'w') as f:
-                json.dump(report, f, indent=2, default=str)
+            self._enqueue_write((_dump_report(report, pretty=True), _dump_report(report) + b'\n'))
+        except Exception as e:
+            self.logger.error(f"Failed to save health report: {e}")
 
-            # Manter histórico
-            self.health_history[report["timestamp"]] = report
+    def get_health_history(self, limit: int = 2880) -> List[Dict[str, Any]]:
+        """Retorna os últimos ``limit`` relatórios do histórico (mais antigo primeiro)
 
-            # Limitar histórico (últimas 24 horas)
-            cutoff = datetime.now() - timedelta(hours=24)
-            self.health_history = {
-                ts: data for ts, data in self.health_history.items()
-                if datetime.fromisoformat(ts.replace('Z', '+00:00')) > cutoff
-            }
+        Lê o arquivo JSONL de trás para frente em blocos, sem carregá-lo inteiro.
+        """
+        try:
+            with open(self.health_report_jsonl, 'rb') as f:
+                pos = f.seek(0, os.SEEK_END)
+                data = b""
+                while pos > 0 and data.count(b'\n') <= limit:
+                    step = min(LOG_TAIL_BYTES, pos)
+                    pos -= step
+                    f.seek(pos)
+                    data = f.read(step) + data
+        except FileNotFoundError:
+            return []
+
+        lines = data.splitlines()
+        if pos > 0:
+            lines = lines[1:]  # Primeira linha do bloco pode estar incompleta
+
+        history = []
+        for line in lines[-limit:]:
+            try:
+                history.append(json.loads(line))
+            except ValueError:
+                continue  # Ignorar linha corrompida (ex.: escrita interrompida)
+        return history
 
-        except Exception as e:
-            self.logger.error(f"Failed to save health report: {e}")
+    def _health_check_interval(self, overall_status: str) -> float:
+        """Intervalo até os próximos health checks
+
+        Dobra a cada ciclo saudável consecutivo (até 16x, limitado a
+        ``max_check_interval``); qualquer outro status volta ao intervalo base.
+        """
+        if overall_status != "healthy":
+            self._healthy_streak = 0
+            return self.check_interval
+
+        self._healthy_streak += 1
+        return min(self.check_interval * (2 ** min(self._healthy_streak, 4)), self.max_check_interval)
 
     async def monitoring_cycle(self):
         """Ciclo principal de monitoramento"""
 
+        self._start_writer()
+        try:
+            await self._monitoring_loop()
+        finally:
+            # A sessão HTTP pertence a este event loop: fechar ao sair do ciclo
+            await self.health_checker.close()
+            await self._stop_writer()
+
+    async def _monitoring_loop(self):
+        """Executa ciclos até que stop() seja chamado"""
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+
         while self.running:
+            # Ciclo anterior estourou o intervalo: realinhar em vez de disparar em rajada
+            if loop.time() - deadline >= self.check_interval:
+                deadline = loop.time()
+            # Próximo ciclo ancorado no início deste, sem acumular o tempo de execução
+            deadline += self.check_interval
             try:
-                self.logger.info("🔍 Executando ciclo de monitoramento...")
-
-                # Coletar métricas
+                # Coletar métricas (sempre no intervalo base)
                 metrics = await self.collect_system_metrics()
-                self.metrics_history.append(metrics)
+                self.record_metrics(metrics)  # sobrescreve a amostra mais antiga
 
-                # Limitar histórico de métricas
-                if len(self.metrics_history) > 2880:  # 24h com checks a cada 30s
-                    self.metrics_history = self.metrics_history[-2880:]
+                now = time.monotonic()
+                if now < self._next_health_check:
+                    await self._sleep_until(loop, deadline)
+                    continue
+
+                self.logger.info("🔍 Executando ciclo de monitoramento...")
 
                 # Executar health checks
                 checks = await self.run_health_checks()
@@ -558,26 +1022,49 @@ class SystemMonitor:
                 # Salvar relatório
                 self.save_health_report(report)
 
+                # Agendar próximos health checks conforme a saúde atual
+                self._next_health_check = now + self._health_check_interval(report["overall_status"])
+
                 # Aguardar próximo ciclo
-                await asyncio.sleep(self.check_interval)
+                await self._sleep_until(loop, deadline)
 
             except Exception as e:
                 self.logger.error(f"Monitoring cycle failed: {e}")
-                await asyncio.sleep(self.check_interval)
+                await self._sleep_until(loop, deadline)
+
+    @staticmethod
+    async def _sleep_until(loop: asyncio.AbstractEventLoop, deadline: float):
+        """Dorme até ``deadline`` (relógio do event loop)"""
+        await asyncio.sleep(max(0.0, deadline - loop.time()))
+
+    async def run(self):
+        """Executa o monitoramento no event loop atual até stop()"""
+        self.running = True
+        await self.monitoring_cycle()
 
     def start(self):
-        """Inicia o monitoramento"""
+        """Inicia o monitoramento
+
+        Com um event loop em execução, agenda ``run()`` como task nesse loop e
+        retorna a task; caso contrário, cria uma thread com loop próprio e
+        retorna a thread.
+        """
         self.logger.info("🚀 Iniciando sistema de monitoramento...")
         self.running = True
 
-        # Executar em thread separada para não bloquear
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None:
+            self._task = loop.create_task(self.run())
+            self.logger.info("✅ Sistema de monitoramento iniciado!")
+            return self._task
+
+        # Sem loop ativo: executar em thread separada para não bloquear
         def run_monitoring():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(self.monitoring_cycle())
-            finally:
-                loop.close()
+            asyncio.run(self.run())
 
         monitoring_thread = threading.Thread(target=run_monitoring, daemon=True)
         monitoring_thread.start()
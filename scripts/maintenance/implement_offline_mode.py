@@ -17,15 +17,103 @@ from robustness_config import setup_global_error_handling
 import os
 import sys
 import json
+import hashlib
 import sqlite3
 import asyncio
+import copy
 import logging
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from uuid import UUID
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from pathlib import Path
 import threading
 import time
 
+import aiohttp
+
+try:
+    import msgpack
+except ImportError:  # msgpack é opcional; sem ele as colunas BLOB guardam JSON
+    msgpack = None
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _normalize(obj: Any) -> Any:
+    """Converte tipos não nativos (datetime -> epoch, UUID -> str) antes de serializar"""
+    if isinstance(obj, _SCALAR_TYPES):
+        return obj
+    if isinstance(obj, dict):
+        return {k: _normalize(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set)):
+        return [_normalize(v) for v in obj]
+    if isinstance(obj, datetime):
+        return int(obj.timestamp())
+    if isinstance(obj, UUID):
+        return str(obj)
+    return obj
+
+
+# Primeiro byte das colunas BLOB: indica o formato do restante
+_FMT_MSGPACK = b"\x01"
+_FMT_JSON = b"\x02"
+
+# PRAGMA user_version do banco offline; 1 = todas as colunas com byte de formato
+DB_FORMAT_VERSION = 1
+
+
+def _pack(data: Any) -> bytes:
+    """Serializa dados para as colunas BLOB do banco offline"""
+    if msgpack is None:
+        return _FMT_JSON + _dumps(_normalize(data))
+    # default=str fica apenas como rede de segurança para tipos não previstos
+    return _FMT_MSGPACK + msgpack.packb(_normalize(data), default=str, use_bin_type=True)
+
+
+def _unpack(value: Any) -> Any:
+    """Desserializa coluna do banco conforme o byte de formato"""
+    if isinstance(value, str):
+        return _loads(value)  # TEXT de bancos antigos
+    tag, payload = value[:1], value[1:]
+    if tag == _FMT_JSON:
+        return _loads(payload)
+    if tag == _FMT_MSGPACK:
+        if msgpack is None:
+            raise ValueError("registro em msgpack, mas msgpack não está instalado")
+        return msgpack.unpackb(payload, raw=False)
+    raise ValueError(f"formato de registro desconhecido: {tag!r}")
+
+
+def _unpack_legacy(value: Any) -> Any:
+    """Desserializa coluna anterior ao byte de formato (TEXT, JSON ou msgpack)"""
+    if isinstance(value, str):
+        return _loads(value)
+    if value[:1] in (_FMT_MSGPACK, _FMT_JSON):
+        return _unpack(value)  # já convertido numa migração anterior incompleta
+    # Os dados gravados são objetos/listas: JSON começa com '{' ou '['
+    if value[:1] in (b"{", b"["):
+        return _loads(value)
+    if msgpack is None:
+        raise ValueError("registro em msgpack, mas msgpack não está instalado")
+    return msgpack.unpackb(value, raw=False)
+
+
+try:
+    import xxhash
+
+    _digest = xxhash.xxh3_64_intdigest
+except ImportError:  # xxhash é opcional; blake2b de 64 bits como fallback
+    def _digest(blob: bytes) -> int:
+        """Hash de 64 bits do conteúdo serializado"""
+        return int.from_bytes(hashlib.blake2b(blob, digest_size=8).digest(), 'little')
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:  # sem requests o modo offline fica permanente
+    requests = None
+
 # Adicionar src ao path
 sys.path.append('/home/brendo/lore/src')
 
@@ -34,6 +122,67 @@ sys.path.append('/home/brendo/lore/src')
 setup_global_error_handling()
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _dumps(data: Any, pretty: bool = False) -> bytes:
+        """Serializa para JSON (datetime nativo no orjson)"""
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+    _loads = orjson.loads
+except ImportError:  # orjson é opcional; json da stdlib como fallback
+    def _dumps(data: Any, pretty: bool = False) -> bytes:
+        """Serializa para JSON com a biblioteca padrão"""
+        return json.dumps(data, indent=2 if pretty else None, default=str).encode('utf-8')
+
+    _loads = json.loads
+
+
+CACHE_MAX_BYTES = 64 * 1024 * 1024  # teto dos arquivos de cache mantidos em memória
+AGENT_CACHE_TTL = 24 * 3600  # validade do cache de agentes (segundos)
+INITIAL_OFFLINE_POPULATION = 10  # agentes criados no universo básico offline
+
+
+class _MtimeLRU:
+    """LRU de arquivos já parseados, invalidada por mtime/tamanho
+
+    Os dados guardados são privados: ``put`` e ``get`` trabalham com cópias,
+    então alterar o resultado de uma carga não afeta as cargas seguintes.
+    """
+
+    def __init__(self, max_bytes: int = CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Path, Tuple[int, int, Any]]" = OrderedDict()
+        self._total_bytes = 0
+
+    def get(self, path: Path, st: os.stat_result) -> Optional[Any]:
+        """Retorna dados em cache se o arquivo não mudou"""
+        entry = self._entries.get(path)
+        if entry is None or entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+            return None
+
+        self._entries.move_to_end(path)
+        return copy.deepcopy(entry[2])
+
+    def put(self, path: Path, st: os.stat_result, data: Any):
+        """Armazena dados do arquivo, removendo os menos usados acima do teto"""
+        old = self._entries.pop(path, None)
+        if old is not None:
+            self._total_bytes -= old[1]
+
+        self._entries[path] = (st.st_mtime_ns, st.st_size, copy.deepcopy(data))
+        self._total_bytes += st.st_size
+
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self._total_bytes -= evicted[1]
+
+    def discard(self, path: Path):
+        """Remove arquivo do cache"""
+        old = self._entries.pop(path, None)
+        if old is not None:
+            self._total_bytes -= old[1]
+
 
 class OfflineCache:
     """Cache local para dados críticos"""
@@ -49,40 +198,97 @@ class OfflineCache:
         self.neural_web_cache = self.cache_dir / "neural_web.json"
         self.metrics_cache = self.cache_dir / "metrics.json"
 
+        # Conteúdo já lido/escrito, reaproveitado enquanto o arquivo não muda
+        self._parse_cache = _MtimeLRU()
+
+    def _write_cache(self, path: Path, cache_data: Dict[str, Any]):
+        """Grava arquivo de cache de forma atômica (temp + rename)"""
+        tmp = path.with_suffix('.json.tmp')
+        tmp.write_bytes(_dumps(cache_data))
+        os.replace(tmp, path)
+
+        self._parse_cache.put(path, path.stat(), cache_data)
+
+    def _read_cache(self, path: Path) -> Dict[str, Any]:
+        """Lê arquivo de cache, reaproveitando o parse se não mudou"""
+        st = path.stat()
+        cache_data = self._parse_cache.get(path, st)
+        if cache_data is None:
+            cache_data = _loads(path.read_bytes())
+            self._parse_cache.put(path, st, cache_data)
+
+        return cache_data
+
+    def debug_dump(self, path: Path) -> str:
+        """Conteúdo de um arquivo de cache formatado para inspeção"""
+        return _dumps(self._read_cache(path), pretty=True).decode()
+
     def save_agents(self, agents_data: List[Dict[str, Any]]):
         """Salva dados de agentes no cache"""
         try:
             cache_data = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp_ns": time.time_ns(),
                 "agents": agents_data,
                 "count": len(agents_data)
             }
 
-            with open(self.agent_cache, 'w') as f:
-                json.dump(cache_data, f, indent=2, default=str)
+            # Snapshot com a data no nome; agents.json é um symlink para ele
+            previous = self._agents_snapshot()
+            snapshot = self.cache_dir / f"agents_{int(time.time())}.json"
+            self._write_cache(snapshot, cache_data)
+
+            link_tmp = self.agent_cache.with_suffix('.json.link')
+            if link_tmp.is_symlink():
+                link_tmp.unlink()
+            os.symlink(snapshot.name, link_tmp)
+            os.replace(link_tmp, self.agent_cache)
+
+            if previous is not None and previous != snapshot:
+                previous.unlink(missing_ok=True)
+                self._parse_cache.discard(previous)
 
             self.logger.info(f"💾 Cache de agentes atualizado: {len(agents_data)} agentes")
 
         except Exception as e:
             self.logger.error(f"Falha ao salvar cache de agentes: {e}")
 
+    def _agents_snapshot(self) -> Optional[Path]:
+        """Snapshot atual do cache de agentes (destino do symlink)"""
+        try:
+            return self.cache_dir / os.readlink(self.agent_cache)
+        except OSError:  # inexistente ou arquivo regular de versões anteriores
+            return None
+
     def load_agents(self) -> List[Dict[str, Any]]:
         """Carrega dados de agentes do cache"""
         try:
-            if self.agent_cache.exists():
-                with open(self.agent_cache, 'r') as f:
-                    cache_data = json.load(f)
-
-                # Verificar se cache não está muito antigo (24 horas)
-                cache_time = datetime.fromisoformat(cache_data["timestamp"])
-                if datetime.now() - cache_time < timedelta(hours=24):
-                    self.logger.info(f"📂 Cache de agentes carregado: {cache_data['count']} agentes")
-                    return cache_data["agents"]
-                else:
+            snapshot = self._agents_snapshot()
+            if snapshot is not None:
+                # Validade pelo nome do arquivo, sem abrir o JSON
+                saved_at = int(snapshot.stem.rsplit('_', 1)[1])
+                if time.time() - saved_at >= AGENT_CACHE_TTL:
                     self.logger.warning("⚠️ Cache de agentes expirado")
+                    return []
+
+                cache_data = self._read_cache(snapshot)
+                self.logger.info(f"📂 Cache de agentes carregado: {cache_data['count']} agentes")
+                return cache_data["agents"]
+
+            cache_data = self._read_cache(self.agent_cache)
+
+            # Formato antigo: verificar timestamp ISO (24 horas)
+            cache_time = datetime.fromisoformat(cache_data["timestamp"])
+            if datetime.now() - cache_time < timedelta(hours=24):
+                self.logger.info(f"📂 Cache de agentes carregado: {cache_data['count']} agentes")
+                return cache_data["agents"]
+            else:
+                self.logger.warning("⚠️ Cache de agentes expirado")
 
             return []
 
+        except FileNotFoundError:
+            return []
+
         except Exception as e:
             self.logger.error(f"Falha ao carregar cache de agentes: {e}")
             return []
@@ -91,12 +297,11 @@ class OfflineCache:
         """Salva estado da população"""
         try:
             cache_data = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp_ns": time.time_ns(),
                 "population": population_data
             }
 
-            with open(self.population_cache, 'w') as f:
-                json.dump(cache_data, f, indent=2, default=str)
+            self._write_cache(self.population_cache, cache_data)
 
             self.logger.info("💾 Estado da população salvo no cache")
 
@@ -106,13 +311,12 @@ class OfflineCache:
     def load_population_state(self) -> Optional[Dict[str, Any]]:
         """Carrega estado da população"""
         try:
-            if self.population_cache.exists():
-                with open(self.population_cache, 'r') as f:
-                    cache_data = json.load(f)
+            cache_data = self._read_cache(self.population_cache)
 
-                self.logger.info("📂 Estado da população carregado do cache")
-                return cache_data["population"]
+            self.logger.info("📂 Estado da população carregado do cache")
+            return cache_data["population"]
 
+        except FileNotFoundError:
             return None
 
         except Exception as e:
@@ -123,12 +327,11 @@ class OfflineCache:
         """Salva dados da neural web"""
         try:
             cache_data = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp_ns": time.time_ns(),
                 "neural_web": neural_web_data
             }
 
-            with open(self.neural_web_cache, 'w') as f:
-                json.dump(cache_data, f, indent=2, default=str)
+            self._write_cache(self.neural_web_cache, cache_data)
 
             self.logger.info("💾 Neural web salva no cache")
 
@@ -138,13 +341,12 @@ class OfflineCache:
     def load_neural_web(self) -> Optional[Dict[str, Any]]:
         """Carrega dados da neural web"""
         try:
-            if self.neural_web_cache.exists():
-                with open(self.neural_web_cache, 'r') as f:
-                    cache_data = json.load(f)
+            cache_data = self._read_cache(self.neural_web_cache)
 
-                self.logger.info("📂 Neural web carregada do cache")
-                return cache_data["neural_web"]
+            self.logger.info("📂 Neural web carregada do cache")
+            return cache_data["neural_web"]
 
+        except FileNotFoundError:
             return None
 
         except Exception as e:
@@ -160,13 +362,66 @@ class OfflineDatabase:
         self.db_path.parent.mkdir(exist_ok=True)
         self.logger = logging.getLogger("OfflineDatabase")
 
+        # Último conteúdo gravado por agente: id -> (nome, hash do DNA),
+        # compartilhado entre threads
+        self._dna_hash: Dict[str, Tuple[str, int]] = {}
+        self._dna_lock = threading.Lock()
+
+        # Uma conexão persistente por thread (evita connect/close a cada operação);
+        # todas ficam registradas para que close() as encerre
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
         # Inicializar banco local
         self.init_database()
 
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Abre conexão com o banco offline já configurada"""
+        # check_same_thread=False apenas para close() poder fechar conexões de
+        # outras threads; cada conexão continua sendo usada só pela sua thread
+        if read_only:
+            conn = sqlite3.connect(
+                f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+            )
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA page_size=4096")  # só tem efeito antes da primeira escrita
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    def _conn(self, read_only: bool = False) -> sqlite3.Connection:
+        """Conexão da thread atual, aberta na primeira utilização"""
+        attr = 'ro_conn' if read_only else 'conn'
+        conn = getattr(self._local, attr, None)
+        if conn is None:
+            conn = self._connect(read_only)
+            setattr(self._local, attr, conn)
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self):
+        """Fecha as conexões abertas por todas as threads"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            # Threads que voltarem a usar o banco abrem conexões novas
+            self._local = threading.local()
+
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                self.logger.error(f"Falha ao fechar conexão offline: {e}")
+
     def init_database(self):
         """Inicializa estrutura do banco offline"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._conn()
             cursor = conn.cursor()
 
             # Tabela de agentes
@@ -174,7 +429,7 @@ class OfflineDatabase:
                 CREATE TABLE IF NOT EXISTS agents (
                     id TEXT PRIMARY KEY,
                     name TEXT NOT NULL,
-                    dna_data TEXT NOT NULL,
+                    dna_data BLOB NOT NULL,
                     status TEXT DEFAULT 'active',
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
@@ -187,7 +442,7 @@ class OfflineDatabase:
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     generation INTEGER NOT NULL,
                     population_size INTEGER NOT NULL,
-                    state_data TEXT NOT NULL,
+                    state_data BLOB NOT NULL,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
@@ -216,54 +471,142 @@ class OfflineDatabase:
                 )
             """)
 
+            # Índices para as consultas de carga
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_agents_status ON agents(status)")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_pop_state_created ON population_state(created_at DESC)"
+            )
+
+            self._migrate_packed_columns(cursor)
+
             conn.commit()
-            conn.close()
 
             self.logger.info("✅ Banco de dados offline inicializado")
 
         except Exception as e:
             self.logger.error(f"Falha ao inicializar banco offline: {e}")
 
+    def _migrate_packed_columns(self, cursor: sqlite3.Cursor):
+        """Regrava colunas serializadas no formato atual
+
+        Bancos anteriores a DB_FORMAT_VERSION têm TEXT em JSON e BLOBs sem
+        byte de formato (msgpack ou JSON); todos são convertidos. Depois disso,
+        com msgpack disponível, BLOBs gravados em JSON passam para msgpack.
+        """
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        legacy = version < DB_FORMAT_VERSION
+        if not legacy and msgpack is None:
+            return
+
+        complete = True
+        for table, column, key in (("agents", "dna_data", "id"), ("population_state", "state_data", "id")):
+            where = "1" if legacy else f"substr({column}, 1, 1) = x'02'"
+            rows = cursor.execute(f"SELECT {key}, {column} FROM {table} WHERE {where}").fetchall()
+
+            updates = []
+            for row_id, value in rows:
+                try:
+                    data = _unpack_legacy(value) if legacy else _unpack(value)
+                except ValueError as e:
+                    self.logger.warning(f"⚠️ Registro {row_id} de {table} não migrado: {e}")
+                    complete = False
+                    continue
+                updates.append((sqlite3.Binary(_pack(data)), row_id))
+
+            if updates:
+                cursor.executemany(f"UPDATE {table} SET {column} = ? WHERE {key} = ?", updates)
+                self.logger.info(f"🔄 {len(updates)} registros de {table} migrados")
+
+        if legacy and complete:
+            cursor.execute(f"PRAGMA user_version = {DB_FORMAT_VERSION}")
+
     def save_agent(self, agent_id: str, name: str, dna_data: Dict[str, Any]):
         """Salva agente no banco offline"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            blob = _pack(dna_data)
+            digest = (name, _digest(blob))
+            with self._dna_lock:
+                if self._dna_hash.get(agent_id) == digest:
+                    return  # nada mudou desde a última gravação
+
+            conn = self._conn()
             cursor = conn.cursor()
 
             cursor.execute("""
                 INSERT OR REPLACE INTO agents (id, name, dna_data, updated_at)
                 VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-            """, (agent_id, name, json.dumps(dna_data, default=str)))
+            """, (agent_id, name, sqlite3.Binary(blob)))
 
             conn.commit()
-            conn.close()
+            with self._dna_lock:
+                self._dna_hash[agent_id] = digest
 
             self.logger.debug(f"💾 Agente {name} salvo no banco offline")
 
         except Exception as e:
             self.logger.error(f"Falha ao salvar agente {agent_id}: {e}")
 
-    def load_agents(self) -> List[Dict[str, Any]]:
-        """Carrega todos os agentes do banco offline"""
+    def save_agents_bulk(self, agents: List[Tuple[str, str, Dict[str, Any]]]):
+        """Salva vários agentes em uma única transação"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            # Ignorar agentes sem mudanças desde a última gravação
+            packed = []
+            for agent_id, name, dna_data in agents:
+                blob = _pack(dna_data)
+                packed.append((agent_id, name, blob, (name, _digest(blob))))
+
+            rows = []
+            digests = {}
+            with self._dna_lock:
+                for agent_id, name, blob, digest in packed:
+                    if self._dna_hash.get(agent_id) != digest:
+                        rows.append((agent_id, name, sqlite3.Binary(blob)))
+                        digests[agent_id] = digest
+
+            if not rows:
+                return
+
+            conn = self._conn()
             cursor = conn.cursor()
 
-            cursor.execute("SELECT id, name, dna_data, status, created_at FROM agents WHERE status = 'active'")
-            rows = cursor.fetchall()
+            cursor.executemany("""
+                INSERT OR REPLACE INTO agents (id, name, dna_data, updated_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            """, rows)
+
+            conn.commit()
+            with self._dna_lock:
+                self._dna_hash.update(digests)
+
+            self.logger.debug(f"💾 {len(rows)} agentes salvos no banco offline")
+
+        except Exception as e:
+            self.logger.error(f"Falha ao salvar agentes em lote: {e}")
+
+    def iter_agents(self, batch_size: int = 512) -> Iterator[Dict[str, Any]]:
+        """Itera os agentes ativos do banco offline em lotes"""
+        cursor = self._conn(read_only=True).cursor()
+        cursor.arraysize = batch_size
+
+        cursor.execute("SELECT id, name, dna_data, status, created_at FROM agents WHERE status = 'active'")
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
 
-            agents = []
             for row in rows:
-                agent_data = {
+                yield {
                     "id": row[0],
                     "name": row[1],
-                    "dna_data": json.loads(row[2]),
+                    "dna_data": _unpack(row[2]),
                     "status": row[3],
                     "created_at": row[4]
                 }
-                agents.append(agent_data)
 
-            conn.close()
+    def load_agents(self) -> List[Dict[str, Any]]:
+        """Carrega todos os agentes do banco offline"""
+        try:
+            agents = list(self.iter_agents())
 
             self.logger.info(f"📂 {len(agents)} agentes carregados do banco offline")
             return agents
@@ -275,16 +618,15 @@ class OfflineDatabase:
     def save_population_state(self, generation: int, population_size: int, state_data: Dict[str, Any]):
         """Salva estado da população"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._conn()
             cursor = conn.cursor()
 
             cursor.execute("""
                 INSERT INTO population_state (generation, population_size, state_data)
                 VALUES (?, ?, ?)
-            """, (generation, population_size, json.dumps(state_data, default=str)))
+            """, (generation, population_size, sqlite3.Binary(_pack(state_data))))
 
             conn.commit()
-            conn.close()
 
             self.logger.info(f"💾 Estado da população salvo (Gen {generation}, Size {population_size})")
 
@@ -294,7 +636,7 @@ class OfflineDatabase:
     def get_latest_population_state(self) -> Optional[Dict[str, Any]]:
         """Obtém último estado da população"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._conn(read_only=True)
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -305,13 +647,12 @@ class OfflineDatabase:
             """)
 
             row = cursor.fetchone()
-            conn.close()
 
             if row:
                 return {
                     "generation": row[0],
                     "population_size": row[1],
-                    "state_data": json.loads(row[2]),
+                    "state_data": _unpack(row[2]),
                     "created_at": row[3]
                 }
 
@@ -334,20 +675,33 @@ class OfflineManager:
         self.api_base_url = "http://localhost:8000"
         self.last_sync = None
 
+        # Sessão HTTP reaproveitada entre verificações (keep-alive)
+        self._session = None
+        if requests is not None:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+
+        # Sessão assíncrona do monitor (criada no loop do monitor)
+        self._aio_session: Optional[aiohttp.ClientSession] = None
+
         # Configurações
         self.sync_interval = 300  # 5 minutos
         self.connectivity_check_interval = 60  # 1 minuto
 
         # Estado offline
-        self.offline_agents = []
+        self.offline_agents: Dict[str, Dict[str, Any]] = {}  # id -> agente
         self.offline_population_state = None
         self.offline_neural_web = None
 
     def check_connectivity(self) -> bool:
         """Verifica conectividade com API"""
+        if self._session is None:
+            return False
+
         try:
-            import requests
-            response = requests.get(f"{self.api_base_url}/health", timeout=5)
+            response = self._session.get(f"{self.api_base_url}/health", timeout=(1, 2))
             return response.status_code == 200
 
         except Exception:
@@ -379,7 +733,7 @@ class OfflineManager:
         """Carrega dados para modo offline"""
         try:
             # Carregar agentes do banco offline
-            self.offline_agents = self.offline_db.load_agents()
+            self.offline_agents = {a["id"]: a for a in self.offline_db.iter_agents()}
 
             # Carregar estado da população
             self.offline_population_state = self.offline_db.get_latest_population_state()
@@ -389,7 +743,7 @@ class OfflineManager:
                 cached_agents = self.cache.load_agents()
                 if cached_agents:
                     self.logger.info("📂 Usando agentes do cache como fallback")
-                    self.offline_agents = cached_agents
+                    self.offline_agents = {a["id"]: a for a in cached_agents}
 
             if not self.offline_population_state:
                 cached_population = self.cache.load_population_state()
@@ -411,7 +765,7 @@ class OfflineManager:
             # Por enquanto, apenas salvamos no cache
 
             if self.offline_agents:
-                self.cache.save_agents(self.offline_agents)
+                self.cache.save_agents(list(self.offline_agents.values()))
 
             if self.offline_population_state:
                 self.cache.save_population_state(self.offline_population_state)
@@ -425,7 +779,7 @@ class OfflineManager:
     def get_agents(self) -> List[Dict[str, Any]]:
         """Obtém agentes (online ou offline)"""
         if self.is_offline:
-            return self.offline_agents
+            return list(self.offline_agents.values())
         else:
             # Tentaria carregar da API aqui
             return []
@@ -439,16 +793,8 @@ class OfflineManager:
                 agent_data.get("dna_data", {})
             )
 
-            # Atualizar lista local
-            existing_ids = [a["id"] for a in self.offline_agents]
-            if agent_data["id"] not in existing_ids:
-                self.offline_agents.append(agent_data)
-            else:
-                # Atualizar agente existente
-                for i, agent in enumerate(self.offline_agents):
-                    if agent["id"] == agent_data["id"]:
-                        self.offline_agents[i] = agent_data
-                        break
+            # Inserir ou atualizar agente local
+            self.offline_agents[agent_data["id"]] = agent_data
 
             self.logger.debug(f"💾 Agente {agent_data['name']} salvo offline")
 
@@ -464,8 +810,9 @@ class OfflineManager:
         if not self.offline_agents:
             self.logger.info("👥 Criando população inicial offline...")
 
-            for i in range(10):
-                agent_data = {
+            now_iso = datetime.now().isoformat()
+            new_agents = [
+                {
                     "id": f"offline_agent_{i}",
                     "name": f"Agent Offline {i+1}",
                     "dna_data": {
@@ -477,10 +824,16 @@ class OfflineManager:
                         "generation": 0
                     },
                     "status": "active",
-                    "created_at": datetime.now().isoformat()
+                    "created_at": now_iso
                 }
+                for i in range(INITIAL_OFFLINE_POPULATION)
+            ]
 
-                self.save_agent_offline(agent_data)
+            # Uma única transação para toda a população inicial
+            self.offline_db.save_agents_bulk(
+                [(a["id"], a["name"], a["dna_data"]) for a in new_agents]
+            )
+            self.offline_agents.update({a["id"]: a for a in new_agents})
 
             self.logger.info(f"✅ {len(self.offline_agents)} agentes criados offline")
 
@@ -514,12 +867,34 @@ class OfflineManager:
         self.logger.info("🌟 Universo offline pronto!")
         return universe_status
 
+    async def _check_async(self) -> bool:
+        """Verifica conectividade com API sem bloquear o loop"""
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=2))
+
+        try:
+            async with self._aio_session.get(f"{self.api_base_url}/health") as response:
+                return response.status == 200
+
+        except (asyncio.TimeoutError, aiohttp.ClientError):
+            return False
+
     async def connectivity_monitor(self):
         """Monitor de conectividade"""
 
+        try:
+            await self._connectivity_loop()
+        finally:
+            if self._aio_session is not None:
+                await self._aio_session.close()
+                self._aio_session = None
+
+    async def _connectivity_loop(self):
+        """Laço de verificação de conectividade"""
+
         while True:
             try:
-                is_connected = self.check_connectivity()
+                is_connected = await self._check_async()
 
                 if is_connected and self.is_offline:
                     self.exit_offline_mode()
@@ -532,9 +907,32 @@ class OfflineManager:
                 self.logger.error(f"Erro no monitor de conectividade: {e}")
                 await asyncio.sleep(self.connectivity_check_interval)
 
+    def _create_monitor_task(self, loop: asyncio.AbstractEventLoop) -> "asyncio.Task":
+        """Cria a task do monitor de conectividade em ``loop``"""
+        task = loop.create_task(self.connectivity_monitor())
+        self.logger.info("🔍 Monitor de conectividade iniciado")
+        return task
+
+    async def start_monitoring_async(self) -> "asyncio.Task":
+        """Agenda o monitor de conectividade no loop em execução"""
+        return self._create_monitor_task(asyncio.get_running_loop())
+
     def start_monitoring(self):
-        """Inicia monitoramento de conectividade"""
+        """Inicia monitoramento de conectividade
+
+        Com um event loop em execução, agenda o monitor como task nesse loop e
+        retorna a task; caso contrário, cria uma thread com loop próprio e
+        retorna a thread.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None:
+            return self._create_monitor_task(loop)
 
+        # Sem loop ativo: executar em thread separada
         def run_monitor():
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
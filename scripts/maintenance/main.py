@@ -16,6 +16,7 @@ import subprocess
 import webbrowser
 from time import sleep
 import threading
+from importlib.metadata import distribution, PackageNotFoundError
 
 # Add the src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -23,12 +24,12 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 def check_dependencies():
     """Verifica se as dependências estão instaladas"""
+    # Consulta apenas os metadados instalados, sem importar os pacotes
     try:
-        import fastapi
-        import uvicorn
-        import streamlit
+        for package in ("fastapi", "uvicorn", "streamlit"):
+            distribution(package)
         return True
-    except ImportError:
+    except PackageNotFoundError:
         return False
 
 
@@ -48,23 +49,16 @@ def start_api_server():
         # Import with proper error handling
         import sys
         import os
-        import importlib.util
+        import importlib
 
         # Add src to path
         src_path = os.path.join(os.path.dirname(__file__), 'src')
-        sys.path.insert(0, src_path)
-
-        # Import api_server module
-        spec = importlib.util.spec_from_file_location(
-            "api_server",
-            os.path.join(src_path, "api_server.py")
-        )
-        if spec is not None and spec.loader is not None:
-            api_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(api_module)
-            app = api_module.app  # type: ignore
-        else:
-            raise ImportError("Could not load api_server module")
+        if src_path not in sys.path:
+            sys.path.insert(0, src_path)
+
+        # Import api_server module (cached in sys.modules, bytecode reused)
+        api_module = importlib.import_module("api_server")
+        app = api_module.app  # type: ignore
 
         import uvicorn
 
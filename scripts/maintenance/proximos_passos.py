@@ -7,8 +7,10 @@ Script interativo para guiar o deploy em produção.
 """
 
 import os
+import sys
 import json
 import subprocess
+import tempfile
 from datetime import datetime
 
 
@@ -107,8 +109,15 @@ API_DESCRIPTION=Sistema de Vida Artificial
 LOG_LEVEL=INFO
 """
 
-    with open(".env.production", "w") as f:
-        f.write(env_content)
+    # Gravação atômica: arquivo temporário no mesmo diretório + rename
+    tmp = tempfile.NamedTemporaryFile("w", dir=".", delete=False)
+    try:
+        with tmp:
+            tmp.write(env_content)
+        os.replace(tmp.name, ".env.production")
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
 
     print("   ✅ Arquivo .env.production criado")
     print("   📋 Copie e configure as variáveis conforme necessário")
@@ -117,8 +126,9 @@ LOG_LEVEL=INFO
 
 def show_deployment_steps():
     """Mostra próximos passos para deploy"""
-    print("📋 PRÓXIMOS PASSOS PARA PRODUÇÃO:")
-    print()
+    buf = []
+    buf.append("📋 PRÓXIMOS PASSOS PARA PRODUÇÃO:")
+    buf.append("")
 
     steps = [
         {
@@ -162,10 +172,12 @@ def show_deployment_steps():
     ]
 
     for step in steps:
-        print(f"   {step['title']}")
+        buf.append(f"   {step['title']}")
         for action in step['actions']:
-            print(f"     {action}")
-        print()
+            buf.append(f"     {action}")
+        buf.append("")
+
+    sys.stdout.write("\n".join(buf) + "\n")
 
 
 def test_local_api():
@@ -196,18 +208,21 @@ def test_local_api():
 
 def show_costs():
     """Mostra estimativa de custos"""
-    print("💰 ESTIMATIVA DE CUSTOS:")
-    print()
-    print("   🆓 TIER GRATUITO (Recomendado):")
-    print("      • Railway: $500 créditos grátis (~100 meses)")
-    print("      • Neon: 0.5GB PostgreSQL grátis")
-    print("      • Total: $0/mês por ~8 meses")
-    print()
-    print("   💰 TIER PAGO (Quando necessário):")
-    print("      • Railway Pro: $5/mês")
-    print("      • Neon Pro: $19/mês")
-    print("      • Total: ~$25/mês")
-    print()
+    buf = []
+    buf.append("💰 ESTIMATIVA DE CUSTOS:")
+    buf.append("")
+    buf.append("   🆓 TIER GRATUITO (Recomendado):")
+    buf.append("      • Railway: $500 créditos grátis (~100 meses)")
+    buf.append("      • Neon: 0.5GB PostgreSQL grátis")
+    buf.append("      • Total: $0/mês por ~8 meses")
+    buf.append("")
+    buf.append("   💰 TIER PAGO (Quando necessário):")
+    buf.append("      • Railway Pro: $5/mês")
+    buf.append("      • Neon Pro: $19/mês")
+    buf.append("      • Total: ~$25/mês")
+    buf.append("")
+
+    sys.stdout.write("\n".join(buf) + "\n")
 
 
 def main():
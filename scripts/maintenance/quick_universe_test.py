@@ -6,19 +6,20 @@ Quick Universe Test - Criar primeiros agentes
 import os
 import sys
 
-# Adicionar src ao path
-sys.path.append('/home/brendo/lore/src')
-
-# Configurar variáveis de ambiente necessárias
-os.environ['KONG_JWT_SECRET'] = 'test-secret-for-universe'
-os.environ['DATABASE_URL'] = 'sqlite:///test_universe.db'
-
 
 def test_agent_creation():
     """Teste rápido de criação de agentes"""
     print("🌟 TESTE RÁPIDO - CRIAÇÃO DE UNIVERSO")
     print("=" * 40)
 
+    # Adicionar src ao path (só quando o teste roda, não ao importar o módulo)
+    if '/home/brendo/lore/src' not in sys.path:
+        sys.path.append('/home/brendo/lore/src')
+
+    # Configurar variáveis de ambiente necessárias
+    os.environ['KONG_JWT_SECRET'] = 'test-secret-for-universe'
+    os.environ['DATABASE_URL'] = 'sqlite:///test_universe.db'
+
     try:
         # Importar componentes necessários
         print("📦 Importando componentes...")
@@ -35,19 +36,19 @@ def test_agent_creation():
 
         # Criar 3 agentes de teste
         print("\n🧬 Criando agentes...")
-        agents = []
-
-        for i in range(3):
-            print(f"  Criando agente {i+1}...")
+        agent_count = 3
 
-            # Gerar DNA
-            dna = AgentDNA.generate_random()
-            agent_id = f"test_agent_{i+1:03d}"
+        # Gerar todos os DNAs primeiro e criar os agentes em lote
+        dnas = [AgentDNA.generate_random() for _ in range(agent_count)]
+        agents = [
+            SocialAgent(f"test_agent_{i+1:03d}", dna, neural_web)
+            for i, dna in enumerate(dnas)
+        ]
 
-            # Criar agente social
-            agent = SocialAgent(agent_id, dna, neural_web)
-            agents.append(agent)
+        # Índice id -> agente, montado uma vez para todas as interações
+        agents_dict = {agent.agent_id: agent for agent in agents}
 
+        for agent in agents:
             print(f"  ✅ {agent.identity.full_name} '{agent.identity.nickname}' criado!")
             print(f"     Personalidade: {agent.identity.personality_archetype}")
 
@@ -70,9 +71,6 @@ def test_agent_creation():
 
             print(f"  {agent1.identity.nickname} tentando conectar com {agent2.identity.nickname}...")
 
-            # Criar dict de agentes para a função
-            agents_dict = {agent.agent_id: agent for agent in agents}
-
             # Tentar conexão
             success = agent1.initiate_connection(agent2.agent_id, agents_dict)
 
@@ -5,146 +5,156 @@ Guia e instruções para reativar o deploy Railway
 """
 
 import os
+import sys
+import shutil
 import subprocess
 import json
+import tempfile
+
+
+# Dados do projeto Railway
+RAILWAY_DATA = {
+    "projectId": "e20bef32-6bb9-4670-8a79-c60fa4939e71",
+    "serviceId": "e5b3e063-be8f-409a-8c78-26dc34fbfa51",
+    "environmentId": "9c86a94e-8c19-47e6-a5e0-5c6a9e27b4b8",
+    "publicDomain": "lore-na-production.up.railway.app",
+    "sshConnection": "ssh root@containers-us-west1.railway.app -p 30625"
+}
+
+# Texto do guia (preenchido com RAILWAY_DATA via format_map)
+_GUIDE_HEADER = """🚂 GUIA DE REATIVAÇÃO DO RAILWAY DEPLOY
+============================================================
+
+## 📋 DADOS DO PROJETO
+- projectId: {projectId}
+- serviceId: {serviceId}
+- environmentId: {environmentId}
+- publicDomain: {publicDomain}
+- sshConnection: {sshConnection}
+
+## 🔧 INSTRUÇÕES DE REATIVAÇÃO
+
+"""
+
+_GUIDE_INSTALL_CLI = """### 1. INSTALAR RAILWAY CLI
+```bash
+# Método 1 - NPM
+npm install -g @railway/cli
+
+# Método 2 - Curl
+curl -fsSL https://railway.app/install.sh | sh
+
+# Método 3 - Homebrew (macOS)
+brew install railway
+```
+
+"""
+
+_GUIDE_BODY = """### 2. LOGIN NO RAILWAY
+```bash
+railway login
+```
+
+### 3. CONECTAR AO PROJETO
+```bash
+railway link {projectId}
+```
+
+### 4. VERIFICAR STATUS
+```bash
+railway status
+railway ps
+```
+
+### 5. REDEPLOYAR SE NECESSÁRIO
+```bash
+# Redeploy do último commit
+railway up
+
+# Ou forçar novo deploy
+railway up --detach
+```
+
+### 6. VERIFICAR LOGS
+```bash
+railway logs
+railway logs --follow
+```
+
+### 7. CONFIGURAR VARIÁVEIS (SE NECESSÁRIO)
+```bash
+railway variables
+railway variables set DATABASE_URL='sua_url_neon'
+railway variables set JWT_SECRET='seu_jwt_secret'
+```
+
+### 8. ACESSO SSH (SE NECESSÁRIO)
+```bash
+{sshConnection}
+```
+
+## 🎯 CHECKLIST DE VERIFICAÇÃO
+- [ ] Railway CLI instalado e logado
+- [ ] Projeto linkado corretamente
+- [ ] Variáveis de ambiente configuradas
+- [ ] Deploy ativo e funcionando
+- [ ] Health check respondendo em /health
+- [ ] Logs sem erros críticos
+
+## 🆘 TROUBLESHOOTING
+
+### Deploy não inicia
+1. Verificar Procfile está correto
+2. Verificar requirements.txt atualizado
+3. Verificar main.py como ponto de entrada
+4. Verificar variáveis de ambiente
+
+### 404 Error
+1. Deploy pode estar pausado por inatividade
+2. Domínio pode ter mudado
+3. Serviço pode ter sido removido
+
+### Database Connection Error
+1. Verificar DATABASE_URL do Neon
+2. Verificar se Neon database está ativo
+3. Verificar conexão de rede
+
+"""
 
 
 def check_railway_cli():
     """Verifica se o Railway CLI está instalado"""
+    # Procurar no PATH antes de tentar executar
+    railway_path = shutil.which('railway')
+    if railway_path is None:
+        print("❌ Railway CLI não encontrado")
+        return False
+
     try:
-        result = subprocess.run(['railway', '--version'], capture_output=True, text=True)
+        result = subprocess.run([railway_path, '--version'], capture_output=True, text=True, timeout=2)
         if result.returncode == 0:
             print(f"✅ Railway CLI instalado: {result.stdout.strip()}")
             return True
         else:
             print("❌ Railway CLI não encontrado")
             return False
-    except FileNotFoundError:
+    except (FileNotFoundError, subprocess.TimeoutExpired):
         print("❌ Railway CLI não encontrado")
         return False
 
 
 def show_reactivation_guide():
     """Mostra guia de reativação"""
+    sys.stdout.write(_GUIDE_HEADER.format_map(RAILWAY_DATA))
 
-    print("🚂 GUIA DE REATIVAÇÃO DO RAILWAY DEPLOY")
-    print("=" * 60)
-    print()
-
-    # Dados do projeto
-    railway_data = {
-        "projectId": "e20bef32-6bb9-4670-8a79-c60fa4939e71",
-        "serviceId": "e5b3e063-be8f-409a-8c78-26dc34fbfa51",
-        "environmentId": "9c86a94e-8c19-47e6-a5e0-5c6a9e27b4b8",
-        "publicDomain": "lore-na-production.up.railway.app",
-        "sshConnection": "ssh root@containers-us-west1.railway.app -p 30625"
-    }
-
-    print("## 📋 DADOS DO PROJETO")
-    for key, value in railway_data.items():
-        print(f"- {key}: {value}")
-    print()
-
-    print("## 🔧 INSTRUÇÕES DE REATIVAÇÃO")
-    print()
-
-    # Verificar se CLI está instalado
+    # Verificar se CLI está instalado (imprime diretamente)
     cli_installed = check_railway_cli()
-    print()
 
+    parts = ["\n"]
     if not cli_installed:
-        print("### 1. INSTALAR RAILWAY CLI")
-        print("```bash")
-        print("# Método 1 - NPM")
-        print("npm install -g @railway/cli")
-        print()
-        print("# Método 2 - Curl")
-        print("curl -fsSL https://railway.app/install.sh | sh")
-        print()
-        print("# Método 3 - Homebrew (macOS)")
-        print("brew install railway")
-        print("```")
-        print()
-
-    print("### 2. LOGIN NO RAILWAY")
-    print("```bash")
-    print("railway login")
-    print("```")
-    print()
-
-    print("### 3. CONECTAR AO PROJETO")
-    print("```bash")
-    print(f"railway link {railway_data['projectId']}")
-    print("```")
-    print()
-
-    print("### 4. VERIFICAR STATUS")
-    print("```bash")
-    print("railway status")
-    print("railway ps")
-    print("```")
-    print()
-
-    print("### 5. REDEPLOYAR SE NECESSÁRIO")
-    print("```bash")
-    print("# Redeploy do último commit")
-    print("railway up")
-    print()
-    print("# Ou forçar novo deploy")
-    print("railway up --detach")
-    print("```")
-    print()
-
-    print("### 6. VERIFICAR LOGS")
-    print("```bash")
-    print("railway logs")
-    print("railway logs --follow")
-    print("```")
-    print()
-
-    print("### 7. CONFIGURAR VARIÁVEIS (SE NECESSÁRIO)")
-    print("```bash")
-    print("railway variables")
-    print("railway variables set DATABASE_URL='sua_url_neon'")
-    print("railway variables set JWT_SECRET='seu_jwt_secret'")
-    print("```")
-    print()
-
-    print("### 8. ACESSO SSH (SE NECESSÁRIO)")
-    print("```bash")
-    print(f"{railway_data['sshConnection']}")
-    print("```")
-    print()
-
-    print("## 🎯 CHECKLIST DE VERIFICAÇÃO")
-    print("- [ ] Railway CLI instalado e logado")
-    print("- [ ] Projeto linkado corretamente")
-    print("- [ ] Variáveis de ambiente configuradas")
-    print("- [ ] Deploy ativo e funcionando")
-    print("- [ ] Health check respondendo em /health")
-    print("- [ ] Logs sem erros críticos")
-    print()
-
-    print("## 🆘 TROUBLESHOOTING")
-    print()
-    print("### Deploy não inicia")
-    print("1. Verificar Procfile está correto")
-    print("2. Verificar requirements.txt atualizado")
-    print("3. Verificar main.py como ponto de entrada")
-    print("4. Verificar variáveis de ambiente")
-    print()
-
-    print("### 404 Error")
-    print("1. Deploy pode estar pausado por inatividade")
-    print("2. Domínio pode ter mudado")
-    print("3. Serviço pode ter sido removido")
-    print()
-
-    print("### Database Connection Error")
-    print("1. Verificar DATABASE_URL do Neon")
-    print("2. Verificar se Neon database está ativo")
-    print("3. Verificar conexão de rede")
-    print()
+        parts.append(_GUIDE_INSTALL_CLI)
+    parts.append(_GUIDE_BODY.format_map(RAILWAY_DATA))
+    sys.stdout.write("".join(parts))
 
 
 def create_reactivation_script():
@@ -188,17 +198,25 @@ railway up --detach
 
 # Verificar logs
 echo "📋 Verificando logs..."
-railway logs --tail 50
+railway logs --tail 50 2>&1 | awk 'NR<=200'
 
 echo "✅ Script de reativação concluído"
 echo "🌐 Teste a URL: https://lore-na-production.up.railway.app"
 """
 
-    with open("/home/brendo/lore/reactivate_railway.sh", "w") as f:
-        f.write(script_content)
-
-    # Tornar executável
-    os.chmod("/home/brendo/lore/reactivate_railway.sh", 0o755)
+    # Gravação atômica: arquivo temporário no mesmo diretório + rename
+    script_path = "/home/brendo/lore/reactivate_railway.sh"
+    tmp = tempfile.NamedTemporaryFile("w", dir=os.path.dirname(script_path), delete=False)
+    try:
+        with tmp:
+            tmp.write(script_content)
+
+        # Tornar executável
+        os.chmod(tmp.name, 0o755)
+        os.replace(tmp.name, script_path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
 
     print("📝 Script de reativação criado: reactivate_railway.sh")
 
@@ -18,14 +18,29 @@ Data: 2025-07-05
 from robustness_config import setup_global_error_handling
 import os
 import sys
+import json
 import asyncio
 import logging
 import signal
+import struct
 import time
 import threading
+import _thread
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import msgpack
+except ImportError:  # msgpack é opcional; sem ele o estado é salvo em JSON
+    msgpack = None
+
+try:
+    import psutil
+except ImportError:  # psutil é opcional; sem ele não há métricas de recursos
+    psutil = None
+
 # Adicionar src ao path
 sys.path.append('/home/brendo/lore/src')
 
@@ -35,6 +50,27 @@ sys.path.append('/home/brendo/lore/src')
 setup_global_error_handling()
 logger = logging.getLogger(__name__)
 
+# Sinais tratados pela thread de sinais (bloqueados nas demais threads)
+SHUTDOWN_SIGNALS = {signal.SIGTERM, signal.SIGINT}
+HANDLED_SIGNALS = SHUTDOWN_SIGNALS | {signal.SIGUSR1}
+
+# Estado persistido: msgpack por padrão, JSON legível com LORE_STATE_JSON=1
+STATE_DIR = Path("/home/brendo/lore/state")
+STATE_JSON = os.getenv("LORE_STATE_JSON") == "1"
+
+# Log incremental entre snapshots: (ciclo, timestamp, último health check)
+STATE_WAL_FILE = "state.wal"
+STATE_WAL_RECORD = struct.Struct("<Qdd")
+STATE_SNAPSHOT_INTERVAL = 1800  # snapshot completo a cada 30 minutos
+
+# Período de um ciclo do universo (segundos)
+CYCLE_INTERVAL = 5.0
+
+# API local usada na verificação de conectividade
+API_HOST = "localhost"
+API_PORT = 8000
+PROBE_TIMEOUT = 0.25
+
 
 class RobustLoreUniverse:
     """Sistema Integrado de Universo Robusto"""
@@ -42,24 +78,58 @@ class RobustLoreUniverse:
     def __init__(self):
         self.logger = logging.getLogger("RobustLoreUniverse")
 
-        # Estados dos sistemas
-        self.systems_status = {
-            "error_handling": False,
-            "monitoring": False,
-            "offline_mode": False,
-            "graceful_shutdown": False,
-            "universe_running": False
-        }
+        # Estados dos sistemas (visão em dicionário via systems_status);
+        # _running é um Event para ser alterado com segurança de outras threads
+        self._error_handling_enabled = False
+        self._monitoring_enabled = False
+        self._offline_mode_enabled = False
+        self._graceful_shutdown_enabled = False
+        self._running = threading.Event()
 
         # Componentes
-        self.monitoring_thread = None
+        self._monitor_task = None
+        self._writer_task = None
+        self._signal_thread = None
+        self._process = None  # psutil.Process do próprio universo
+
+        # Pool único para trabalho bloqueante (gravação de estado) fora do event loop
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="lore-robust")
+        self._state_lock = threading.Lock()
+
+        # Comunicação entre a thread de sinais e o event loop
+        self._loop = None
+        self._shutdown_event = None
+        self._shutdown_reason = None
+        self._save_requested = None
         self.offline_manager = None
         self.shutdown_manager = None
 
         # Estado do universo
         self.start_time = None
+        self.start_monotonic = None
         self.cycle_count = 0
         self.last_health_check = None
+        self.online = False
+
+        # Dicionário reutilizado a cada snapshot
+        self._state_template = {
+            "timestamp": None,
+            "systems_status": None,
+            "cycle_count": 0,
+            "start_time": None,
+            "last_health_check": None,
+            "uptime_seconds": 0.0
+        }
+
+        # Persistência: último estado conhecido e log incremental
+        self.previous_state = self.load_last_state()
+        self._last_snapshot = time.monotonic()
+        self._wal = None
+        try:
+            STATE_DIR.mkdir(parents=True, exist_ok=True)
+            self._wal = open(STATE_DIR / STATE_WAL_FILE, "ab", buffering=0)
+        except OSError as e:
+            self.logger.error(f"❌ Falha ao abrir log de estado: {e}")
 
         self.logger.info("🌟 Sistema Integrado de Robustez inicializado")
 
@@ -81,50 +151,69 @@ class RobustLoreUniverse:
 
             sys.excepthook = handle_exception
 
-            self.systems_status["error_handling"] = True
+            self._error_handling_enabled = True
             self.logger.info("✅ Sistema de tratamento de erros ativo")
 
         except Exception as e:
             self.logger.error(f"❌ Falha ao inicializar tratamento de erros: {e}")
 
-    def initialize_monitoring(self):
-        """Inicializa sistema de monitoramento"""
-        try:
-            self.logger.info("📊 Inicializando monitoramento...")
-
-            # Simular sistema de monitoramento básico
-            def monitoring_loop():
-                while self.systems_status.get("monitoring", False):
-                    try:
-                        # Health check básico
-                        self.last_health_check = datetime.now()
-
-                        # Verificar recursos do sistema
-                        try:
-                            import psutil
-                            cpu = psutil.cpu_percent(interval=0.1)
-                            memory = psutil.virtual_memory().percent
-
-                            if cpu > 90 or memory > 90:
-                                self.logger.warning(f"⚠️ Recursos altos - CPU: {cpu}%, RAM: {memory}%")
-                        except ImportError:
-                            pass
+    async def _monitor_loop(self):
+        """Loop de monitoramento (task no event loop do universo)"""
+        while self._monitoring_enabled:
+            try:
+                # Health check a cada 30s
+                await asyncio.sleep(30)
+
+                # Health check básico
+                self.last_health_check = datetime.now()
+
+                # Verificar recursos do sistema (leituras não bloqueantes)
+                if psutil is not None:
+                    cpu = psutil.cpu_percent(interval=None)
+                    memory = psutil.virtual_memory().percent
+
+                    if cpu > 90 or memory > 90:
+                        self.logger.warning("⚠️ Recursos altos - CPU: %s%%, RAM: %s%%", cpu, memory)
+
+                # Reverificar conectividade com a API local
+                if self._offline_mode_enabled:
+                    online = await self._probe_online()
+                    if online != self.online:
+                        self.online = online
+                        self.logger.info("🌐 Conectividade alterada: %s", "Online" if online else "Offline")
+
+                # Verificar universo
+                if self._running.is_set() and self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("💓 Health check - Uptime: %.0fs, Ciclos: %d",
+                                     self.uptime_seconds(), self.cycle_count)
+                    if self._process is not None:
+                        rss_mb = self._process.memory_info().rss / (1024 * 1024)
+                        self.logger.info("🧠 Memória do processo: %.1f MB", rss_mb)
+
+            except asyncio.CancelledError:
+                raise
 
-                        # Verificar universo
-                        if self.systems_status["universe_running"]:
-                            uptime = (datetime.now() - self.start_time).total_seconds() if self.start_time else 0
-                            self.logger.info(f"💓 Health check - Uptime: {uptime:.0f}s, Ciclos: {self.cycle_count}")
+            except Exception as e:
+                self.logger.error("Erro no monitoramento: %s", e)
 
-                        time.sleep(30)  # Health check a cada 30s
+    def initialize_monitoring(self):
+        """Inicializa sistema de monitoramento
 
-                    except Exception as e:
-                        self.logger.error(f"Erro no monitoramento: {e}")
-                        time.sleep(30)
+        O loop de monitoramento roda como task no event loop do universo,
+        iniciada por ``run_universe``.
+        """
+        try:
+            self.logger.info("📊 Inicializando monitoramento...")
 
-            self.monitoring_thread = threading.Thread(target=monitoring_loop, daemon=True)
-            self.monitoring_thread.start()
+            if psutil is not None:
+                # Primeira leitura só inicializa a medição; as seguintes
+                # retornam o uso desde a chamada anterior, sem bloquear
+                psutil.cpu_percent(interval=None)
+                self._process = psutil.Process(os.getpid())
+            else:
+                self.logger.warning("⚠️ psutil não instalado - métricas de recursos desativadas")
 
-            self.systems_status["monitoring"] = True
+            self._monitoring_enabled = True
             self.logger.info("✅ Sistema de monitoramento ativo")
 
         except Exception as e:
@@ -142,100 +231,217 @@ class RobustLoreUniverse:
             data_dir = Path("/home/brendo/lore/data")
             data_dir.mkdir(exist_ok=True)
 
-            # Verificar conectividade
-            try:
-                import requests
-                response = requests.get("http://localhost:8000/health", timeout=5)
-                online = response.status_code == 200
-            except:
-                online = False
+            # Verificar conectividade (reverificada a cada health check)
+            self.online = asyncio.run(self._probe_online())
 
-            self.logger.info(f"🌐 Status de conectividade: {'Online' if online else 'Offline'}")
+            self.logger.info(f"🌐 Status de conectividade: {'Online' if self.online else 'Offline'}")
 
-            self.systems_status["offline_mode"] = True
+            self._offline_mode_enabled = True
             self.logger.info("✅ Sistema de modo offline ativo")
 
         except Exception as e:
             self.logger.error(f"❌ Falha ao inicializar modo offline: {e}")
 
+    async def _probe_online(self) -> bool:
+        """Verifica se a API local aceita conexões TCP"""
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(API_HOST, API_PORT), timeout=PROBE_TIMEOUT
+            )
+        except (OSError, asyncio.TimeoutError):
+            return False
+
+        writer.close()
+        return True
+
     def initialize_graceful_shutdown(self):
         """Inicializa sistema de graceful shutdown"""
         try:
             self.logger.info("⚡ Inicializando graceful shutdown...")
 
-            # Registrar handlers de sinal
-            def signal_handler(signum, frame):
-                signal_names = {
-                    signal.SIGTERM: "SIGTERM",
-                    signal.SIGINT: "SIGINT",
-                    signal.SIGUSR1: "SIGUSR1"
-                }
-
-                signal_name = signal_names.get(signum, f"Signal {signum}")
-                self.logger.info(f"🔔 Sinal recebido: {signal_name}")
-
-                if signum in [signal.SIGTERM, signal.SIGINT]:
-                    self.graceful_shutdown(signal_name)
-                elif signum == signal.SIGUSR1:
-                    self.save_state()
+            # Bloquear os sinais nesta thread (máscara herdada pelas threads
+            # criadas depois) e recebê-los de forma síncrona numa thread dedicada,
+            # fora do contexto de signal handler
+            signal.pthread_sigmask(signal.SIG_BLOCK, HANDLED_SIGNALS)
 
-            signal.signal(signal.SIGTERM, signal_handler)
-            signal.signal(signal.SIGINT, signal_handler)
-            signal.signal(signal.SIGUSR1, signal_handler)
+            self._signal_thread = threading.Thread(
+                target=self._sigwait_loop, name="lore-signals", daemon=True
+            )
+            self._signal_thread.start()
 
-            self.systems_status["graceful_shutdown"] = True
+            self._graceful_shutdown_enabled = True
             self.logger.info("✅ Sistema de graceful shutdown ativo")
 
         except Exception as e:
             self.logger.error(f"❌ Falha ao inicializar graceful shutdown: {e}")
 
+    def _sigwait_loop(self):
+        """Aguarda sinais e repassa o trabalho ao event loop
+
+        Os sinais ficam bloqueados nas demais threads: esta thread não pode
+        morrer, então erros no tratamento de um sinal são apenas registrados.
+        """
+        while True:
+            signum = signal.sigwait(HANDLED_SIGNALS)
+            try:
+                self._dispatch_signal(signum)
+            except Exception:
+                self.logger.exception("❌ Erro ao tratar sinal %s", signum)
+
+    def _dispatch_signal(self, signum: int):
+        """Trata um sinal recebido pela thread de sinais"""
+        signal_name = signal.Signals(signum).name
+        self.logger.info(f"🔔 Sinal recebido: {signal_name}")
+
+        loop = self._loop
+        loop_running = loop is not None and loop.is_running()
+
+        if signum in SHUTDOWN_SIGNALS:
+            self._shutdown_reason = signal_name
+            if loop_running:
+                loop.call_soon_threadsafe(self._shutdown_event.set)
+                return
+
+            # Sem universo em execução: shutdown gracioso aqui (salva o
+            # estado) e então interromper a thread principal
+            try:
+                self.graceful_shutdown(signal_name)
+            except SystemExit:
+                pass
+            _thread.interrupt_main()
+        elif signum == signal.SIGUSR1:
+            if loop_running:
+                # Pedidos repetidos antes da gravação viram um só
+                loop.call_soon_threadsafe(self._save_requested.set)
+            else:
+                self.save_state()
+
+    async def _state_writer(self):
+        """Grava o estado sob demanda, agrupando pedidos pendentes"""
+        while True:
+            await self._save_requested.wait()
+            self._save_requested.clear()
+            await self._async_save_state()
+
+    async def _async_save_state(self):
+        """Salva estado a partir do event loop, sem bloqueá-lo"""
+        await asyncio.get_running_loop().run_in_executor(self._executor, self.save_state)
+
     def save_state(self):
         """Salva estado atual do sistema"""
+        with self._state_lock:
+            self._save_state()
+
+    def _save_state(self):
+        """Grava o snapshot (chamado com _state_lock adquirido)"""
         try:
             self.logger.info("💾 Salvando estado do sistema...")
 
-            state_dir = Path("/home/brendo/lore/state")
+            state_dir = STATE_DIR
             state_dir.mkdir(exist_ok=True)
 
-            # Estado do sistema
-            system_state = {
-                "timestamp": datetime.now().isoformat(),
-                "systems_status": self.systems_status,
-                "cycle_count": self.cycle_count,
-                "start_time": self.start_time.isoformat() if self.start_time else None,
-                "last_health_check": self.last_health_check.isoformat() if self.last_health_check else None,
-                "uptime_seconds": (datetime.now() - self.start_time).total_seconds() if self.start_time else 0
-            }
-
-            import json
-            with open(state_dir / "robust_system_state.json", 'w') as f:
-                json.dump(system_state, f, indent=2)
+            # Estado do sistema (datas como epoch em segundos)
+            system_state = self._state_template
+            system_state["timestamp"] = time.time()
+            system_state["systems_status"] = self.systems_status
+            system_state["cycle_count"] = self.cycle_count
+            system_state["start_time"] = self.start_time.timestamp() if self.start_time else None
+            system_state["last_health_check"] = self.last_health_check.timestamp() if self.last_health_check else None
+            system_state["uptime_seconds"] = self.uptime_seconds()
+
+            if msgpack is None or STATE_JSON:
+                payload = json.dumps(system_state, indent=2).encode('utf-8')
+                state_file = state_dir / "robust_system_state.json"
+            else:
+                payload = msgpack.packb(system_state, use_bin_type=True)
+                state_file = state_dir / "robust_system_state.msgpack"
+
+            # Gravação atômica: temporário no mesmo diretório + fsync + rename
+            fd, tmp_path = tempfile.mkstemp(dir=state_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, state_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+            # O snapshot substitui os registros incrementais anteriores
+            self._last_snapshot = time.monotonic()
+            if self._wal is not None:
+                self._wal.truncate(0)
 
             self.logger.info("✅ Estado salvo com sucesso")
 
         except Exception as e:
             self.logger.error(f"❌ Falha ao salvar estado: {e}")
 
+    def append_state_record(self):
+        """Registra ciclo atual no log incremental (registro de tamanho fixo)"""
+        if self._wal is None:
+            return
+
+        try:
+            health_ts = self.last_health_check.timestamp() if self.last_health_check else 0.0
+            self._wal.write(STATE_WAL_RECORD.pack(self.cycle_count, time.time(), health_ts))
+        except OSError as e:
+            self.logger.error(f"❌ Falha ao registrar estado: {e}")
+
+    def load_last_state(self) -> dict:
+        """Carrega o último snapshot salvo, atualizado pelo último registro do log"""
+        state = {}
+        try:
+            snapshot = STATE_DIR / "robust_system_state.msgpack"
+            if msgpack is not None and snapshot.exists():
+                state = msgpack.unpackb(snapshot.read_bytes(), raw=False)
+            elif (STATE_DIR / "robust_system_state.json").exists():
+                state = json.loads((STATE_DIR / "robust_system_state.json").read_text())
+
+            wal_path = STATE_DIR / STATE_WAL_FILE
+            size = wal_path.stat().st_size if wal_path.exists() else 0
+            if size >= STATE_WAL_RECORD.size:
+                with open(wal_path, "rb") as f:
+                    f.seek((size // STATE_WAL_RECORD.size - 1) * STATE_WAL_RECORD.size)
+                    cycle_count, timestamp, health_ts = STATE_WAL_RECORD.unpack(f.read(STATE_WAL_RECORD.size))
+                state.update(
+                    cycle_count=cycle_count,
+                    timestamp=timestamp,
+                    last_health_check=health_ts or None
+                )
+
+            if state:
+                self.logger.info(f"📂 Último estado persistido: ciclo {state.get('cycle_count')}")
+
+        except Exception as e:
+            self.logger.error(f"❌ Falha ao carregar último estado: {e}")
+
+        return state
+
     def graceful_shutdown(self, reason: str):
         """Executa shutdown gracioso"""
         self.logger.info(f"🛑 Iniciando shutdown gracioso - Razão: {reason}")
 
         try:
             # 1. Parar universo
-            if self.systems_status["universe_running"]:
+            if self._running.is_set():
                 self.logger.info("🌍 Parando universo...")
-                self.systems_status["universe_running"] = False
+                self._running.clear()
 
             # 2. Parar monitoramento
-            if self.systems_status["monitoring"]:
+            if self._monitoring_enabled:
                 self.logger.info("📊 Parando monitoramento...")
-                self.systems_status["monitoring"] = False
+                self._monitoring_enabled = False
+                if self._monitor_task is not None:
+                    self._monitor_task.cancel()
 
             # 3. Salvar estado final
             self.save_state()
 
             # 4. Limpeza final
             self.logger.info("🧹 Executando limpeza final...")
+            self._executor.shutdown(wait=False, cancel_futures=True)
 
             shutdown_time = time.time()
             self.logger.info("✅ Shutdown gracioso concluído")
@@ -258,12 +464,13 @@ class RobustLoreUniverse:
         self.initialize_graceful_shutdown()
 
         # Verificar status
-        active_systems = sum(1 for status in self.systems_status.values() if status)
-        total_systems = len(self.systems_status)
+        systems_status = self.systems_status
+        active_systems = sum(1 for status in systems_status.values() if status)
+        total_systems = len(systems_status)
 
         self.logger.info(f"📊 SISTEMAS ATIVOS: {active_systems}/{total_systems}")
 
-        for system, status in self.systems_status.items():
+        for system, status in systems_status.items():
             status_icon = "✅" if status else "❌"
             self.logger.info(f"   {status_icon} {system}: {'ATIVO' if status else 'INATIVO'}")
 
@@ -280,8 +487,9 @@ class RobustLoreUniverse:
             self.logger.info("🌍 Iniciando universo robusto...")
 
             self.start_time = datetime.now()
+            self.start_monotonic = time.monotonic()
             self.cycle_count = 0
-            self.systems_status["universe_running"] = True
+            self._running.set()
 
             self.logger.info("✅ Universo robusto iniciado!")
             return True
@@ -293,62 +501,119 @@ class RobustLoreUniverse:
     async def run_universe_cycle(self):
         """Executa um ciclo do universo"""
         try:
-            if not self.systems_status["universe_running"]:
+            if not self._running.is_set():
                 return
 
             self.cycle_count += 1
 
-            # Simular atividade do universo
-            current_time = datetime.now()
-            uptime = (current_time - self.start_time).total_seconds()
-
             # Log a cada 10 ciclos
             if self.cycle_count % 10 == 0:
-                self.logger.info(f"🔄 Ciclo {self.cycle_count} - Uptime: {uptime:.0f}s")
+                self.logger.info("🔄 Ciclo %d - Uptime: %.0fs", self.cycle_count, self.uptime_seconds())
 
-            # Salvar estado periodicamente (a cada 60 ciclos = ~5 minutos)
+            # Registrar estado periodicamente (a cada 60 ciclos = ~5 minutos);
+            # snapshot completo só a cada STATE_SNAPSHOT_INTERVAL
             if self.cycle_count % 60 == 0:
-                self.save_state()
+                self.append_state_record()
+                if time.monotonic() - self._last_snapshot >= STATE_SNAPSHOT_INTERVAL:
+                    if self._save_requested is not None:
+                        self._save_requested.set()
+                    else:
+                        # Ciclo executado fora de run_universe: sem task de gravação
+                        await self._async_save_state()
 
             return True
 
         except Exception as e:
-            self.logger.error(f"❌ Erro no ciclo {self.cycle_count}: {e}")
+            self.logger.error("❌ Erro no ciclo %d: %s", self.cycle_count, e)
             return False
 
     async def run_universe(self, duration: int = 300):
         """Executa universo por duração especificada"""
-        self.logger.info(f"🎯 Executando universo robusto por {duration} segundos...")
+        self.logger.info("🎯 Executando universo robusto por %d segundos...", duration)
 
         end_time = time.time() + duration
 
-        while time.time() < end_time and self.systems_status["universe_running"]:
-            try:
-                # Executar ciclo
-                await self.run_universe_cycle()
+        # Evento sinalizado pela thread de sinais (SIGINT/SIGTERM)
+        self._shutdown_event = asyncio.Event()
+        if self._shutdown_reason:
+            self._shutdown_event.set()
+        self._save_requested = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
 
-                # Aguardar próximo ciclo (5 segundos)
-                await asyncio.sleep(5)
+        self._writer_task = asyncio.create_task(self._state_writer())
+        if self._monitoring_enabled:
+            self._monitor_task = asyncio.create_task(self._monitor_loop())
 
-            except Exception as e:
-                self.logger.error(f"❌ Erro na execução do universo: {e}")
-                # Continuar execução (robustez)
-                await asyncio.sleep(5)
+        # Ritmo guiado por prazo: o período real não acumula o tempo de trabalho
+        monotonic = time.monotonic
+        running = self._running.is_set
+        next_tick = monotonic()
 
-        final_uptime = (datetime.now() - self.start_time).total_seconds()
-        self.logger.info(f"✅ Universo executado - {self.cycle_count} ciclos, {final_uptime:.0f}s uptime")
+        try:
+            while time.time() < end_time and running():
+                if self._shutdown_event.is_set():
+                    self.graceful_shutdown(self._shutdown_reason)
+
+                try:
+                    # Executar ciclo
+                    await self.run_universe_cycle()
+
+                except Exception as e:
+                    self.logger.error("❌ Erro na execução do universo: %s", e)
+                    # Continuar execução (robustez)
+
+                # Aguardar próximo ciclo (5 segundos) ou pedido de shutdown
+                next_tick += CYCLE_INTERVAL
+                delay = next_tick - monotonic()
+                if delay < 0:
+                    self.logger.warning("⚠️ Ciclo %d atrasado %.2fs - reajustando ritmo", self.cycle_count, -delay)
+                    next_tick = monotonic()
+                    delay = 0
+                try:
+                    await asyncio.wait_for(self._shutdown_event.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._loop = None
+            self._writer_task.cancel()
+            self._writer_task = None
+            if self._monitor_task is not None:
+                self._monitor_task.cancel()
+            # Eventos pertencem a este loop: ciclos posteriores gravam direto
+            self._save_requested = None
+            self._shutdown_event = None
+
+        self.logger.info("✅ Universo executado - %d ciclos, %.0fs uptime", self.cycle_count, self.uptime_seconds())
+
+    def uptime_seconds(self) -> float:
+        """Tempo de execução do universo (relógio monotônico)"""
+        if self.start_monotonic is None:
+            return 0
+        return time.monotonic() - self.start_monotonic
+
+    @property
+    def systems_status(self) -> dict:
+        """Estado de cada sistema de robustez"""
+        return {
+            "error_handling": self._error_handling_enabled,
+            "monitoring": self._monitoring_enabled,
+            "offline_mode": self._offline_mode_enabled,
+            "graceful_shutdown": self._graceful_shutdown_enabled,
+            "universe_running": self._running.is_set()
+        }
 
     def get_system_status(self) -> dict:
         """Retorna status completo do sistema"""
-        uptime = (datetime.now() - self.start_time).total_seconds() if self.start_time else 0
+        uptime = self.uptime_seconds()
+        systems_status = self.systems_status
 
         return {
             "timestamp": datetime.now().isoformat(),
-            "systems_status": self.systems_status,
+            "systems_status": systems_status,
             "cycle_count": self.cycle_count,
             "uptime_seconds": uptime,
             "last_health_check": self.last_health_check.isoformat() if self.last_health_check else None,
-            "robustness_score": sum(1 for status in self.systems_status.values() if status) / len(self.systems_status) * 100
+            "robustness_score": sum(1 for status in systems_status.values() if status) / len(systems_status) * 100
         }
 
 
@@ -405,7 +670,8 @@ def main():
         loop.run_until_complete(robust_universe.run_universe(duration=120))
 
     except KeyboardInterrupt:
-        print("\n🔔 SIGINT recebido - iniciando shutdown gracioso...")
+        reason = robust_universe._shutdown_reason or "SIGINT"
+        print(f"\n🔔 {reason} recebido - shutdown gracioso executado")
         # O sistema de shutdown cuidará do resto
 
     except Exception as e: